@@ -3,10 +3,30 @@
 import dagger
 from typing import Self
 
+# Where execs wrapped by tail_capture() write their output inside the container
+_STDOUT_PATH = "/tmp/.exec_stdout"
+_STDERR_PATH = "/tmp/.exec_stderr"
+
+
+def tail_capture(command: list[str]) -> list[str]:
+    """Wrap a command so its output goes to files instead of the exec's streams.
+
+    ExecResult.from_ctr(ctr, tail_bytes) then reads back only the tail. On a
+    non-zero exit the files are replayed to stdout/stderr, so dagger.ExecError
+    still carries the complete output.
+    """
+    script = (
+        f'"$@" >{_STDOUT_PATH} 2>{_STDERR_PATH}; rc=$?; '
+        f'if [ $rc -ne 0 ]; then cat {_STDOUT_PATH}; cat {_STDERR_PATH} >&2; fi; exit $rc'
+    )
+    return ["sh", "-c", script, "sh", *command]
+
 
 class ExecResult:
     """Result of executing a command in a Dagger container."""
 
+    __slots__ = ("exit_code", "stdout", "stderr")
+
     exit_code: int
     stdout: str
     stderr: str
@@ -17,10 +37,22 @@ class ExecResult:
         self.stderr = stderr
 
     @classmethod
-    async def from_ctr(cls, ctr: dagger.Container) -> Self:
-        """Create ExecResult from a Dagger container."""
+    async def from_ctr(cls, ctr: dagger.Container, tail_bytes: int | None = None) -> Self:
+        """Create ExecResult from a Dagger container.
+
+        Args:
+            ctr: Container whose last exec produced the result
+            tail_bytes: Fetch only the last N bytes of stdout/stderr; the exec
+                must have been wrapped with tail_capture() (None keeps everything)
+        """
+        exit_code = await ctr.exit_code()
+        if tail_bytes is not None:
+            # Trim inside the container so only the tail crosses the API
+            ctr = ctr.with_exec([
+                "sh", "-c", f"tail -c {tail_bytes} {_STDOUT_PATH}; tail -c {tail_bytes} {_STDERR_PATH} >&2",
+            ])
         return cls(
-            exit_code=await ctr.exit_code(),
+            exit_code=exit_code,
             stdout=await ctr.stdout(),
             stderr=await ctr.stderr(),
         )
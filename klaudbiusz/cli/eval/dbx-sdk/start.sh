@@ -48,9 +48,14 @@ if [ ! -f "package.json" ]; then
     exit 1
 fi
 
-# Start the app in background (redirect output to prevent Python subprocess hang)
+# Start the app in background (redirect output to prevent Python subprocess hang).
+# Job control puts it in its own process group; stop.sh kills exactly that
+# group (found via the per-port PID file) so parallel evals don't touch each other.
+set -m
 npm start >/dev/null 2>&1 &
 APP_PID=$!
+set +m
+echo "$APP_PID" > "${TMPDIR:-/tmp}/klaudbiusz-eval-${DATABRICKS_APP_PORT}.pid"
 
 # Wait for app to start (5 seconds for npm apps)
 sleep 5
@@ -59,42 +59,55 @@ ENV_VARS+=("-e" "DATABRICKS_CLIENT_ID=${DATABRICKS_CLIENT_ID}")
 ENV_VARS+=("-e" "DATABRICKS_CLIENT_SECRET=${DATABRICKS_CLIENT_SECRET}")
 ENV_VARS+=("-e" "DATABRICKS_APP_NAME=${DATABRICKS_APP_NAME}")
 
-# Add server plugin requirements
-DATABRICKS_APP_PORT="${DATABRICKS_APP_PORT:-8000}"
+# Add server plugin requirements. DATABRICKS_APP_PORT from the caller is the
+# host port to publish on; inside the container the app always listens on
+# CONTAINER_PORT, which is what it is told via DATABRICKS_APP_PORT.
+HOST_PORT="${DATABRICKS_APP_PORT:-8000}"
+CONTAINER_PORT=8000
 FLASK_RUN_HOST="${FLASK_RUN_HOST:-0.0.0.0}"
-ENV_VARS+=("-e" "DATABRICKS_APP_PORT=${DATABRICKS_APP_PORT}")
+ENV_VARS+=("-e" "DATABRICKS_APP_PORT=${CONTAINER_PORT}")
 ENV_VARS+=("-e" "FLASK_RUN_HOST=${FLASK_RUN_HOST}")
 
+# Subscribe to die events for this container so a crash ends the wait at once.
+# --since replays events that fire before we start reading, --until bounds the
+# stream (~25s). Readiness itself is probed from the host, so app images need
+# no curl/wget of their own.
+SINCE=$(date +%s)
+DEADLINE=$((SINCE + 25))
+exec 3< <(docker events \
+    --since "${SINCE}" \
+    --until "${DEADLINE}" \
+    --filter "container=${CONTAINER_NAME}" \
+    --filter "event=die" \
+    --format '{{.Status}}' 2>/dev/null)
+EVENTS_PID=$!
+trap 'kill ${EVENTS_PID} 2>/dev/null || true' EXIT
+
 # Run the container
-docker run -d -p ${DATABRICKS_APP_PORT}:8000 \
+docker run -d -p ${HOST_PORT}:${CONTAINER_PORT} \
     --name "${CONTAINER_NAME}" \
     ${ENV_FILE_ARGS} \
     "${ENV_VARS[@]}" \
     "eval-${APP_NAME}" >/dev/null
 
-# Wait for container to start (3 seconds for Docker)
-sleep 3
-
-# Check if container is still running
-if ! docker ps --filter "name=${CONTAINER_NAME}" --format "{{.Names}}" | grep -q "${CONTAINER_NAME}"; then
-    echo "❌ Error: Container died during startup" >&2
-    exit 1
-fi
-
-# Health check with retries (3 attempts, 2s timeout each, 1s apart)
-# Docker apps should have proper /healthcheck endpoint
-for i in {1..3}; do
-    if curl -f -s --max-time 2 http://localhost:${DATABRICKS_APP_PORT}/healthcheck >/dev/null 2>&1; then
+# Probe the published port from the host until the app answers, the container
+# dies, or the deadline passes
+while [ "$(date +%s)" -lt "${DEADLINE}" ]; do
+    if curl -f -s --max-time 2 http://localhost:${HOST_PORT}/healthcheck >/dev/null 2>&1; then
         echo "✅ App ready (healthcheck)" >&2
         exit 0
     fi
 
-    # Wait before retry (except on last attempt)
-    if [ $i -lt 3 ]; then
+    # Wait up to 1s for a die event before the next probe (status > 128 is the
+    # read timeout; anything else means the event stream closed, so just pause)
+    if read -r -t 1 -u 3 EVENT; then
+        echo "❌ Error: Container died during startup" >&2
+        exit 1
+    elif [ $? -le 128 ]; then
         sleep 1
     fi
 done
 
-# Failed to connect
+# Never became ready in time
 echo "❌ Error: App failed health check" >&2
 exit 1
@@ -1,17 +1,20 @@
 #!/bin/bash
 
 # tRPC template stop script
-# Cleans up npm processes and port 8000
+# Stops the app started by start.sh on DATABRICKS_APP_PORT (default 8000).
+# Only that app's process group and port are touched, so apps evaluated
+# concurrently on other ports keep running.
 
-# Kill processes on port 8000
-lsof -ti:8000 2>/dev/null | xargs kill -9 2>/dev/null || true
+DATABRICKS_APP_PORT="${DATABRICKS_APP_PORT:-8000}"
+PID_FILE="${TMPDIR:-/tmp}/klaudbiusz-eval-${DATABRICKS_APP_PORT}.pid"
 
-# Kill npm start processes
-pkill -f "npm start" 2>/dev/null || true
+# Kill the process group start.sh launched (npm start -> tsx/node)
+if [ -f "$PID_FILE" ]; then
+    kill -9 -- "-$(cat "$PID_FILE")" 2>/dev/null || true
+    rm -f "$PID_FILE"
+fi
 
-# Kill tsx server processes (both server/index.ts and server/src/index.ts)
-pkill -f "tsx server/index.ts" 2>/dev/null || true
-pkill -f "tsx server/src/index.ts" 2>/dev/null || true
-pkill -f "tsx.*server.*index" 2>/dev/null || true
+# Kill anything still listening on this app's port
+lsof -ti "tcp:${DATABRICKS_APP_PORT}" -sTCP:LISTEN 2>/dev/null | xargs kill -9 2>/dev/null || true
 
 exit 0
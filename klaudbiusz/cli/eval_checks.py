@@ -1,15 +1,45 @@
 """Shared evaluation check functions for Klaudbiusz evaluation framework."""
 
+import asyncio
+import functools
 import json
+import re
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
-def check_databricks_connectivity(
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once per process and shared by every file scan
+_PROCEDURE_RE = re.compile(r"^\s*(\w+)\s*:\s*publicProcedure", re.M)
+# query = `...` template literals, keeping escaped backticks inside the literal
+_SQL_QUERY_RE = re.compile(r"query\s*=\s*`((?:[^`\\]|\\.)+)`", re.S)
+
+
+@functools.lru_cache(maxsize=512)
+def _load_sql_queries(path: str, mtime_ns: int) -> tuple[str, ...]:
+    """Extract inline SQL queries from a TypeScript source file.
+
+    Keyed on mtime so an edited file is re-read; only the parsed queries
+    are kept, not the file text.
+    """
+    content = Path(path).read_text()
+    return tuple(m.group(1) for m in _SQL_QUERY_RE.finditer(content) if m.group(1).strip())
+
+
+async def check_databricks_connectivity(
     app_dir: Path,
     port: int,
-    run_command: Callable,
+    run_command: Callable | None = None,
     template: str = "trpc",
+    base_url: str | None = None,
 ) -> bool:
     """
     Check if app can connect to Databricks and execute queries.
@@ -17,69 +47,97 @@ def check_databricks_connectivity(
     Args:
         app_dir: Path to the app directory
         port: Port where the app is running (8000 or 3000)
-        run_command: Function to execute shell commands (success, stdout, stderr)
+        run_command: Optional fallback to run curl (success, stdout, stderr) when httpx isn't installed
         template: Template type ("trpc", "dbx-sdk", or "unknown")
+        base_url: Where the app is reachable (e.g. a Dagger tunnel); defaults to http://localhost:{port}
 
     Returns:
         True if Databricks connectivity works, False otherwise
     """
+    base_url = base_url or f"http://localhost:{port}"
     if template == "dbx-sdk":
-        return _check_dbx_sdk_connectivity(app_dir, port, run_command)
+        return await _check_dbx_sdk_connectivity(app_dir, base_url, run_command)
     elif template == "trpc":
-        return _check_trpc_connectivity(app_dir, port, run_command)
+        return await _check_trpc_connectivity(app_dir, base_url, run_command)
     else:
         # Try both methods for unknown templates
         return (
-            _check_trpc_connectivity(app_dir, port, run_command)
-            or _check_dbx_sdk_connectivity(app_dir, port, run_command)
+            await _check_trpc_connectivity(app_dir, base_url, run_command)
+            or await _check_dbx_sdk_connectivity(app_dir, base_url, run_command)
         )
 
 
-def _check_trpc_connectivity(app_dir: Path, port: int, run_command: Callable) -> bool:
+async def _probe_all(requests: list[tuple[str, str]], run_command: Callable | None) -> list[Any]:
+    """Issue (method, url) probes concurrently; returns parsed JSON bodies (None on failure)."""
+    if httpx is not None:
+        # One pooled keep-alive client shared by all probes of this check
+        async with httpx.AsyncClient(timeout=60, limits=httpx.Limits(max_keepalive_connections=32)) as client:
+            return await asyncio.gather(*[_probe_httpx(client, method, url) for method, url in requests])
+    if run_command is not None:
+        return await asyncio.gather(
+            *[asyncio.to_thread(_probe_curl, run_command, method, url) for method, url in requests]
+        )
+    return [None] * len(requests)
+
+
+async def _probe_httpx(client: "httpx.AsyncClient", method: str, url: str) -> Any:
+    """Send a probe with httpx and return the JSON body, or None."""
+    try:
+        if method == "POST":
+            response = await client.post(url, json={})
+        else:
+            response = await client.get(url)
+        response.raise_for_status()
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    except (httpx.HTTPError, ValueError):
+        return None
+
+
+def _probe_curl(run_command: Callable, method: str, url: str) -> Any:
+    """Send a probe with curl and return the JSON body, or None."""
+    cmd = ["curl", "-f", "-s", url]
+    if method == "POST":
+        cmd += ["-X", "POST", "-H", "Content-Type: application/json", "-d", "{}"]
+    success, stdout, _ = run_command(cmd, timeout=60)
+    if not success:
+        return None
+    try:
+        return orjson.loads(stdout) if orjson is not None else json.loads(stdout)
+    except json.JSONDecodeError:
+        return None
+
+
+async def _check_trpc_connectivity(app_dir: Path, base_url: str, run_command: Callable | None) -> bool:
     """Check tRPC-based app connectivity."""
     # Discover available procedures by inspecting the router
     index_ts = app_dir / "server" / "src" / "index.ts"
     if not index_ts.exists():
         return False
 
-    # Look for procedure names in the file
-    content = index_ts.read_text()
+    # Look for the first few data procedure names (skip healthcheck), reading
+    # the router line by line and stopping as soon as we have enough
     procedures = []
-    for line in content.split("\n"):
-        if "publicProcedure" in line and ":" in line:
-            # Extract procedure name (simple heuristic)
-            parts = line.split(":")
-            if parts:
-                proc_name = parts[0].strip()
-                if proc_name and proc_name != "healthcheck":
-                    procedures.append(proc_name)
-
-    # Try first few data procedures (skip healthcheck)
-    for proc in procedures[:3]:  # Try up to 3 endpoints
-        # Try GET request first (standard for tRPC queries)
-        success, stdout, _ = run_command(
-            [
-                "curl",
-                "-f",
-                "-s",
-                f"http://localhost:{port}/api/trpc/{proc}",
-            ],
-            timeout=60,
-        )
+    with index_ts.open() as fh:
+        for line in fh:
+            m = _PROCEDURE_RE.match(line)
+            if m and m.group(1) != "healthcheck":
+                procedures.append(m.group(1))
+                if len(procedures) >= 3:  # Try up to 3 endpoints
+                    break
 
-        if success:
-            try:
-                result = json.loads(stdout)
-                # Check if we got data back
-                if result and "result" in result:
-                    return True
-            except json.JSONDecodeError:
-                pass
+    # Probe them with GET (standard for tRPC queries)
+    results = await _probe_all(
+        [("GET", f"{base_url}/api/trpc/{proc}") for proc in procedures],
+        run_command,
+    )
 
-    return False
+    # Check if we got data back
+    return any(result and isinstance(result, dict) and "result" in result for result in results)
 
 
-def _check_dbx_sdk_connectivity(app_dir: Path, port: int, run_command: Callable) -> bool:
+async def _check_dbx_sdk_connectivity(app_dir: Path, base_url: str, run_command: Callable | None) -> bool:
     """Check DBX SDK-based app connectivity."""
     # Look for SQL query files in config/queries/
     queries_dir = app_dir / "config" / "queries"
@@ -90,37 +148,14 @@ def _check_dbx_sdk_connectivity(app_dir: Path, port: int, run_command: Callable)
     if not sql_files:
         return False
 
-    # Try calling analytics API endpoints
-    for sql_file in sql_files[:3]:  # Try first 3 queries
-        query_key = sql_file.stem  # Filename without .sql extension
-
-        # Try POST request to analytics endpoint
-        success, stdout, _ = run_command(
-            [
-                "curl",
-                "-f",
-                "-s",
-                "-X",
-                "POST",
-                f"http://localhost:{port}/api/analytics/{query_key}",
-                "-H",
-                "Content-Type: application/json",
-                "-d",
-                "{}",
-            ],
-            timeout=60,
-        )
-
-        if success:
-            try:
-                result = json.loads(stdout)
-                # Check if we got data back (array or object with data)
-                if result and (isinstance(result, list) or isinstance(result, dict)):
-                    return True
-            except json.JSONDecodeError:
-                pass
+    # Try POST requests to analytics endpoints for the first 3 queries
+    results = await _probe_all(
+        [("POST", f"{base_url}/api/analytics/{sql_file.stem}") for sql_file in sql_files[:3]],
+        run_command,
+    )
 
-    return False
+    # Check if we got data back (array or object with data)
+    return any(result and isinstance(result, (list, dict)) for result in results)
 
 
 def extract_sql_queries(app_dir: Path, template: str = "trpc") -> list[str]:
@@ -156,21 +191,8 @@ def _extract_trpc_queries(app_dir: Path) -> list[str]:
         return queries
 
     for ts_file in server_src.glob("**/*.ts"):
-        content = ts_file.read_text()
         # Look for SQL queries in template literals
-        if "query = `" in content or "query=`" in content:
-            # Simple extraction - get text between backticks after "query"
-            parts = content.split("query")
-            for part in parts[1:]:
-                if part.strip().startswith("="):
-                    rest = part[part.index("=") + 1 :].strip()
-                    if rest.startswith("`"):
-                        # Find matching backtick
-                        end = rest.find("`", 1)
-                        if end > 0:
-                            query = rest[1:end]
-                            if query.strip():
-                                queries.append(query)
+        queries.extend(_load_sql_queries(str(ts_file), ts_file.stat().st_mtime_ns))
 
     return queries
 
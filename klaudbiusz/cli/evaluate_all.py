@@ -17,22 +17,50 @@ Usage:
 
 import argparse
 import asyncio
+import bisect
 import fnmatch
-import json
+import functools
+import re
+import subprocess
 import sys
-from datetime import datetime
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+from io import StringIO
+from operator import itemgetter
 import time
 from collections import Counter, defaultdict
-from dataclasses import asdict
+from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-# Load environment variables
 try:
-    from dotenv import load_dotenv
+    import numpy as np
+except ImportError:
+    np = None
+
+from eval_metrics import eff_units
+
+# Latest JSON, CSV and markdown reports in app-eval/; older ones are renamed
+# to <stem>_<timestamp><suffix> when a new run writes its reports
+REPORT_JSON = "evaluation_report.json"
+REPORT_CSV = "evaluation_report.csv"
+REPORT_MD = "EVALUATION_REPORT.md"
+
+# The Dagger SDK and the evaluation modules (anthropic, PIL, ...) are slow to
+# import, so they are imported where first needed; --help and runs that match
+# no apps never load them.
+if TYPE_CHECKING:
+    import dagger
+
+
+@functools.cache
+def _load_env_once() -> None:
+    """Load environment variables from .env files (once per process)."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+
+    # Load environment variables from .env file
+    load_dotenv()
     env_paths = [
         Path(__file__).parent.parent.parent / "edda" / ".env",
         Path(__file__).parent.parent / ".env",
@@ -41,29 +69,35 @@ try:
         if env_path.exists():
             load_dotenv(env_path)
             break
-except ImportError:
-    pass
 
-import dagger
 
-# Import async Dagger-based evaluation
-from evaluate_app_dagger import evaluate_app_async
-from eval_metrics import eff_units
+@functools.cache
+def _find_bulk_run_results() -> Path | None:
+    """Locate the newest bulk_run_results file (resolved once per process)."""
+    script_dir = Path(__file__).parent
+    results_files = sorted(script_dir.glob("../bulk_run_results_*.json"), reverse=True)
+    if not results_files:
+        results_files = sorted(script_dir.glob("../app/bulk_run_results_*.json"), reverse=True)
+    return results_files[0] if results_files else None
 
 
-def get_git_commit_hash() -> str | None:
-    """Get the current git commit hash."""
-    import subprocess
+async def get_git_commit_hash_async() -> str | None:
+    """Get the current git commit hash without blocking the event loop."""
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
+        proc = await asyncio.create_subprocess_exec(
+            "git", "rev-parse", "HEAD",
             cwd=Path(__file__).parent.parent,
-            capture_output=True,
-            text=True,
-            timeout=5
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return None
+        if proc.returncode == 0:
+            return stdout.decode().strip() or None
     except Exception:
         pass
     return None
@@ -72,10 +106,20 @@ def get_git_commit_hash() -> str | None:
 def load_prompts_and_metrics_from_bulk_run() -> tuple[dict[str, str], dict[str, dict], dict[str, str]]:
     """Load prompts and generation metrics using PROMPTS dict from bulk_run.
 
+    The parsed data is cached for the process; callers get fresh top-level
+    dicts so they can override entries (e.g. run config from CLI args).
+
     Returns:
         (prompts_dict, metrics_dict, run_config_dict) where metrics_dict contains cost_usd, input_tokens, output_tokens, turns
         and run_config_dict contains mcp_binary, backend, model
     """
+    prompts, gen_metrics, run_config = _load_prompts_and_metrics()
+    return dict(prompts), dict(gen_metrics), dict(run_config)
+
+
+@functools.cache
+def _load_prompts_and_metrics() -> tuple[dict[str, str], dict[str, dict], dict[str, str]]:
+    """Uncached body of load_prompts_and_metrics_from_bulk_run."""
     try:
         # Import PROMPTS from bulk_run.py
         from bulk_run import PROMPTS
@@ -83,17 +127,15 @@ def load_prompts_and_metrics_from_bulk_run() -> tuple[dict[str, str], dict[str,
         return {}, {}, {}
 
     # Look for bulk_run_results file
-    script_dir = Path(__file__).parent
-    results_files = sorted(script_dir.glob("../bulk_run_results_*.json"), reverse=True)
-    if not results_files:
-        results_files = sorted(script_dir.glob("../app/bulk_run_results_*.json"), reverse=True)
-
-    if not results_files:
+    results_file = _find_bulk_run_results()
+    if results_file is None:
         return dict(PROMPTS), {}, {}
 
+    from evaluate_app import json_loads
+
     # Load generation metrics from results file
     try:
-        data = json.loads(results_files[0].read_text())
+        data = json_loads(results_file.read_bytes())
 
         # Extract run configuration from first result
         run_config = {}
@@ -105,24 +147,24 @@ def load_prompts_and_metrics_from_bulk_run() -> tuple[dict[str, str], dict[str,
                 "model": first_result.get("model"),
             }
 
-        # Create a prompt->metrics mapping
-        prompt_to_metrics = {}
-        for result in data:
-            prompt = result.get("prompt")
-            metrics = result.get("metrics", {})
-            if prompt:
-                prompt_to_metrics[prompt] = {
-                    "cost_usd": metrics.get("cost_usd", 0),
-                    "input_tokens": metrics.get("input_tokens", 0),
-                    "output_tokens": metrics.get("output_tokens", 0),
-                    "turns": metrics.get("turns", 0),
-                }
-
-        # Match app names to metrics using PROMPTS dict
-        gen_metrics = {}
+        # Invert PROMPTS once, then match app names to metrics in a single pass
+        # over the results (later results for the same prompt win)
+        prompt_to_apps = defaultdict(list)
         for app_name, prompt in PROMPTS.items():
-            if prompt in prompt_to_metrics:
-                gen_metrics[app_name] = prompt_to_metrics[prompt]
+            prompt_to_apps[prompt].append(app_name)
+
+        gen_metrics = {
+            app_name: {
+                "cost_usd": metrics.get("cost_usd", 0),
+                "input_tokens": metrics.get("input_tokens", 0),
+                "output_tokens": metrics.get("output_tokens", 0),
+                "turns": metrics.get("turns", 0),
+            }
+            for result in data
+            if (prompt := result.get("prompt")) in prompt_to_apps
+            for metrics in (result.get("metrics", {}),)
+            for app_name in prompt_to_apps[prompt]
+        }
 
         return dict(PROMPTS), gen_metrics, run_config
 
@@ -130,255 +172,379 @@ def load_prompts_and_metrics_from_bulk_run() -> tuple[dict[str, str], dict[str,
         return dict(PROMPTS), {}, {}
 
 
-def generate_summary_report(results: list[dict]) -> dict:
-    """Generate summary statistics from evaluation results."""
-    total = len(results)
+@dataclass(slots=True)
+class ReportColumns:
+    """Per-app values the detailed report sections need, as parallel columns."""
 
-    # Template distribution
-    template_counts = Counter()
+    app_name: list[str]
+    issue_count: list[int]
+    type_safety: list[bool]
+    tests_pass: list[bool]
+    coverage: list[float]
+
+
+def to_columns(results: list[dict]) -> ReportColumns:
+    """Extract the report columns from results in a single walk."""
+    cols = ReportColumns([], [], [], [], [])
     for r in results:
-        template = r["metrics"].get("template_type", "unknown")
-        template_counts[template] += 1
+        m = r["metrics"]
+        cols.app_name.append(r["app_name"])
+        cols.issue_count.append(len(r["issues"]))
+        cols.type_safety.append(m["type_safety"])
+        cols.tests_pass.append(m["tests_pass"])
+        cols.coverage.append(m["test_coverage_pct"])
+    return cols
+
+
+# Boolean metrics counted as passes, and numeric metrics/generation metrics summed
+_COUNT_METRICS = (
+    "build_success",
+    "runtime_success",
+    "type_safety",
+    "tests_pass",
+    "databricks_connectivity",
+    "data_returned",
+    "ui_renders",
+)
+_SUM_METRICS = (
+    "test_coverage_pct",
+    "local_runability_score",
+    "deployability_score",
+    "total_loc",
+    "build_time_sec",
+    "startup_time_sec",
+)
+_GEN_SUM_METRICS = ("cost_usd", "input_tokens", "output_tokens", "turns")
+# Metrics that are integers in the result dicts and stay integers in the summary
+_INT_SUMS = frozenset({"total_loc", "input_tokens", "output_tokens", "turns"})
+
+if np is not None:
+    _TOTALS_DTYPE = np.dtype(
+        [(name, "?") for name in _COUNT_METRICS]
+        + [(name, "i8" if name in _INT_SUMS else "f8") for name in _SUM_METRICS]
+        + [(f"gen_{name}", "i8" if name in _INT_SUMS else "f8") for name in _GEN_SUM_METRICS]
+        + [("appeval_100", "f8"), ("eff_units", "f8")]
+    )
 
-    # Overall statistics - All 9 metrics
-    stats = {
-        "total_apps": total,
-        "evaluated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-        "template_distribution": dict(template_counts),
-        "metrics_summary": {
-            # Composite & Efficiency Metrics
-            "avg_appeval_100": sum(r["metrics"].get("appeval_100", 0) for r in results) / total if total > 0 else 0,
-            "avg_eff_units": sum(r["metrics"].get("eff_units", 0) for r in results if r["metrics"].get("eff_units") is not None) / len([r for r in results if r["metrics"].get("eff_units") is not None]) if len([r for r in results if r["metrics"].get("eff_units") is not None]) > 0 else None,
-            # Metric 1-4: Core functionality
-            "build_success": sum(1 for r in results if r["metrics"]["build_success"]),
-            "runtime_success": sum(1 for r in results if r["metrics"]["runtime_success"]),
-            "type_safety_pass": sum(1 for r in results if r["metrics"]["type_safety"]),
-            "tests_pass": sum(1 for r in results if r["metrics"]["tests_pass"]),
-            "avg_coverage": sum(r["metrics"]["test_coverage_pct"] for r in results) / total if total > 0 else 0,
-            # Metric 5-6: Databricks
-            "databricks_connectivity": sum(1 for r in results if r["metrics"]["databricks_connectivity"]),
-            "data_returned": sum(1 for r in results if r["metrics"]["data_returned"]),
-            # Metric 7: UI
-            "ui_renders": sum(1 for r in results if r["metrics"]["ui_renders"]),
-            # Metric 8-9: DevX
-            "local_runability_avg": sum(r["metrics"]["local_runability_score"] for r in results) / total if total > 0 else 0,
-            "deployability_avg": sum(r["metrics"]["deployability_score"] for r in results) / total if total > 0 else 0,
-            # Metadata
-            "total_loc": sum(r["metrics"]["total_loc"] for r in results),
-            "avg_loc_per_app": sum(r["metrics"]["total_loc"] for r in results) / total if total > 0 else 0,
-            "avg_build_time": sum(r["metrics"]["build_time_sec"] for r in results) / total if total > 0 else 0,
-            "avg_startup_time": sum(r["metrics"]["startup_time_sec"] for r in results) / total if total > 0 else 0,
-        },
-        "generation_metrics": {
-            "total_cost_usd": sum(r.get("generation_metrics", {}).get("cost_usd", 0) for r in results),
-            "avg_cost_usd": sum(r.get("generation_metrics", {}).get("cost_usd", 0) for r in results) / total if total > 0 else 0,
-            "total_input_tokens": sum(r.get("generation_metrics", {}).get("input_tokens", 0) for r in results),
-            "total_output_tokens": sum(r.get("generation_metrics", {}).get("output_tokens", 0) for r in results),
-            "avg_input_tokens": sum(r.get("generation_metrics", {}).get("input_tokens", 0) for r in results) / total if total > 0 else 0,
-            "avg_output_tokens": sum(r.get("generation_metrics", {}).get("output_tokens", 0) for r in results) / total if total > 0 else 0,
-            "avg_turns": sum(r.get("generation_metrics", {}).get("turns", 0) for r in results) / total if total > 0 else 0,
-            "avg_tokens_per_turn": (sum(r.get("generation_metrics", {}).get("output_tokens", 0) for r in results) / sum(r.get("generation_metrics", {}).get("turns", 0) for r in results)) if sum(r.get("generation_metrics", {}).get("turns", 0) for r in results) > 0 else 0,
-        },
-        "quality_distribution": {
-            "excellent": [],  # No issues
-            "good": [],       # 1-2 issues
-            "fair": [],       # 3-4 issues
-            "poor": []        # 5+ issues
-        },
-        "common_issues": Counter(),
-        "devx_scores": {
-            "5_stars": [],  # Both local & deploy >= 4
-            "4_stars": [],  # Both >= 3
-            "3_stars": [],  # Both >= 2
-            "2_stars": [],  # At least one < 2
-        },
+
+def _metric_totals(results: list[dict]) -> dict:
+    """Pass counts and sums for the numeric summary metrics.
+
+    Returns a dict keyed by metric name (generation metrics prefixed with
+    ``gen_``) plus ``eff_units_count``, the number of apps with eff_units.
+    With numpy the results are packed into one record array and reduced
+    column by column; otherwise they are accumulated in a plain loop.
+    """
+    if np is not None and results:
+        def row(result):
+            m = result["metrics"]
+            gm = result.get("generation_metrics", {})
+            eff = m.get("eff_units")
+            return (
+                *(m[name] for name in _COUNT_METRICS),
+                *(m[name] for name in _SUM_METRICS),
+                *(gm.get(name, 0) for name in _GEN_SUM_METRICS),
+                m.get("appeval_100", 0),
+                np.nan if eff is None else eff,
+            )
+
+        arr = np.fromiter(map(row, results), dtype=_TOTALS_DTYPE, count=len(results))
+        totals = {name: arr[name].sum().item() for name in _TOTALS_DTYPE.names}
+        eff = arr["eff_units"]
+        has_eff = ~np.isnan(eff)
+        totals["eff_units"] = eff[has_eff].sum().item()
+        totals["eff_units_count"] = int(has_eff.sum())
+        return totals
+
+    totals = dict.fromkeys(
+        (*_COUNT_METRICS, *_SUM_METRICS, *(f"gen_{name}" for name in _GEN_SUM_METRICS),
+         "appeval_100", "eff_units", "eff_units_count"),
+        0,
+    )
+    for result in results:
+        m = result["metrics"]
+        gm = result.get("generation_metrics", {})
+        for name in _COUNT_METRICS:
+            totals[name] += 1 if m[name] else 0
+        for name in _SUM_METRICS:
+            totals[name] += m[name]
+        for name in _GEN_SUM_METRICS:
+            totals[f"gen_{name}"] += gm.get(name, 0)
+        totals["appeval_100"] += m.get("appeval_100", 0)
+        if m.get("eff_units") is not None:
+            totals["eff_units"] += m["eff_units"]
+            totals["eff_units_count"] += 1
+    return totals
+
+
+def generate_summary_report(results: list[dict], run_ts: str | None = None) -> dict:
+    """Generate summary statistics from evaluation results.
+
+    Args:
+        results: Per-app result dicts
+        run_ts: Run-wide UTC timestamp shared by all reports; defaults to now
+    """
+    total = len(results)
+
+    totals = _metric_totals(results)
+
+    # Categorical statistics need the app names, so they stay a Python loop
+    template_counts = Counter()
+    common_issues = Counter()
+    quality_distribution = {
+        "excellent": [],  # No issues
+        "good": [],       # 1-2 issues
+        "fair": [],       # 3-4 issues
+        "poor": []        # 5+ issues
+    }
+    devx_scores = {
+        "5_stars": [],  # Both local & deploy >= 4
+        "4_stars": [],  # Both >= 3
+        "3_stars": [],  # Both >= 2
+        "2_stars": [],  # At least one < 2
     }
 
-    # Analyze each app
     for result in results:
         app_name = result["app_name"]
-        issues = result["issues"]
-        issue_count = len(issues)
+        m = result["metrics"]
+
+        template_counts[m.get("template_type", "unknown")] += 1
+        local = m["local_runability_score"]
+        deploy = m["deployability_score"]
 
         # Quality distribution
+        issues = result["issues"]
+        issue_count = len(issues)
         if issue_count == 0:
-            stats["quality_distribution"]["excellent"].append(app_name)
+            quality_distribution["excellent"].append(app_name)
         elif issue_count <= 2:
-            stats["quality_distribution"]["good"].append(app_name)
+            quality_distribution["good"].append(app_name)
         elif issue_count <= 4:
-            stats["quality_distribution"]["fair"].append(app_name)
+            quality_distribution["fair"].append(app_name)
         else:
-            stats["quality_distribution"]["poor"].append(app_name)
+            quality_distribution["poor"].append(app_name)
 
         # Count common issues
-        for issue in issues:
-            stats["common_issues"][issue] += 1
+        common_issues.update(issues)
 
         # DevX scoring
-        local = result["metrics"]["local_runability_score"]
-        deploy = result["metrics"]["deployability_score"]
-
         if local >= 4 and deploy >= 4:
-            stats["devx_scores"]["5_stars"].append(app_name)
+            devx_scores["5_stars"].append(app_name)
         elif local >= 3 and deploy >= 3:
-            stats["devx_scores"]["4_stars"].append(app_name)
+            devx_scores["4_stars"].append(app_name)
         elif local >= 2 and deploy >= 2:
-            stats["devx_scores"]["3_stars"].append(app_name)
+            devx_scores["3_stars"].append(app_name)
         else:
-            stats["devx_scores"]["2_stars"].append(app_name)
+            devx_scores["2_stars"].append(app_name)
 
-    # Convert Counter to dict for JSON serialization
-    stats["common_issues"] = dict(stats["common_issues"].most_common(10))
+    def avg(value_sum):
+        return value_sum / total if total > 0 else 0
+
+    # Overall statistics - All 9 metrics
+    stats = {
+        "total_apps": total,
+        "evaluated_at": run_ts or time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "template_distribution": dict(template_counts),
+        "metrics_summary": {
+            # Composite & Efficiency Metrics
+            "avg_appeval_100": avg(totals["appeval_100"]),
+            "avg_eff_units": (
+                totals["eff_units"] / totals["eff_units_count"] if totals["eff_units_count"] > 0 else None
+            ),
+            # Metric 1-4: Core functionality
+            "build_success": totals["build_success"],
+            "runtime_success": totals["runtime_success"],
+            "type_safety_pass": totals["type_safety"],
+            "tests_pass": totals["tests_pass"],
+            "avg_coverage": avg(totals["test_coverage_pct"]),
+            # Metric 5-6: Databricks
+            "databricks_connectivity": totals["databricks_connectivity"],
+            "data_returned": totals["data_returned"],
+            # Metric 7: UI
+            "ui_renders": totals["ui_renders"],
+            # Metric 8-9: DevX
+            "local_runability_avg": avg(totals["local_runability_score"]),
+            "deployability_avg": avg(totals["deployability_score"]),
+            # Metadata
+            "total_loc": totals["total_loc"],
+            "avg_loc_per_app": avg(totals["total_loc"]),
+            "avg_build_time": avg(totals["build_time_sec"]),
+            "avg_startup_time": avg(totals["startup_time_sec"]),
+        },
+        "generation_metrics": {
+            "total_cost_usd": totals["gen_cost_usd"],
+            "avg_cost_usd": avg(totals["gen_cost_usd"]),
+            "total_input_tokens": totals["gen_input_tokens"],
+            "total_output_tokens": totals["gen_output_tokens"],
+            "avg_input_tokens": avg(totals["gen_input_tokens"]),
+            "avg_output_tokens": avg(totals["gen_output_tokens"]),
+            "avg_turns": avg(totals["gen_turns"]),
+            "avg_tokens_per_turn": (
+                totals["gen_output_tokens"] / totals["gen_turns"] if totals["gen_turns"] > 0 else 0
+            ),
+        },
+        "quality_distribution": quality_distribution,
+        # Convert Counter to dict for JSON serialization
+        "common_issues": dict(common_issues.most_common(10)),
+        "devx_scores": devx_scores,
+    }
 
     return stats
 
 
-def generate_markdown_report(results: list[dict], summary: dict) -> str:
-    """Generate a markdown report."""
-    md = []
+def generate_markdown_report(results: list[dict], summary: dict, cols: ReportColumns | None = None) -> str:
+    """Generate a markdown report.
 
-    md.append("# App Evaluation Report")
-    md.append(f"\n**Generated:** {summary['evaluated_at']}")
-    md.append(f"\n**Total Apps Evaluated:** {summary['total_apps']}")
+    Args:
+        results: Per-app result dicts
+        summary: Output of generate_summary_report
+        cols: Columns from to_columns(results); extracted here if not given
+    """
+    if cols is None:
+        cols = to_columns(results)
+    buf = StringIO()
+    w = buf.write
+    total = summary['total_apps']
+    # Multiply by this instead of dividing by total for every percentage
+    to_pct = 100.0 / total if total > 0 else 0.0
+
+    w("# App Evaluation Report\n")
+    w(f"\n**Generated:** {summary['evaluated_at']}\n")
+    w(f"\n**Total Apps Evaluated:** {summary['total_apps']}\n")
 
     # Template distribution
     if "template_distribution" in summary:
-        md.append("\n### Template Distribution")
+        w("\n### Template Distribution\n")
         for template, count in sorted(summary["template_distribution"].items()):
-            pct = (count / summary['total_apps'] * 100) if summary['total_apps'] > 0 else 0
-            md.append(f"- **{template}:** {count} apps ({pct:.1f}%)")
+            pct = count * to_pct
+            w(f"- **{template}:** {count} apps ({pct:.1f}%)\n")
 
     # Executive Summary - All 9 metrics
-    md.append("\n## Executive Summary\n")
+    w("\n## Executive Summary\n\n")
     metrics = summary["metrics_summary"]
-    total = summary['total_apps']
 
     # Top-level metrics
-    md.append(f"**📊 Overall Quality Score:** {metrics['avg_appeval_100']:.1f}/100")
+    w(f"**📊 Overall Quality Score:** {metrics['avg_appeval_100']:.1f}/100\n")
     if metrics.get('avg_eff_units') is not None:
-        md.append(f"**⚡ Average Efficiency:** {metrics['avg_eff_units']:.1f} units (lower is better)\n")
+        w(f"**⚡ Average Efficiency:** {metrics['avg_eff_units']:.1f} units (lower is better)\n\n")
     else:
-        md.append("")
+        w("\n")
 
-    md.append("### Core Functionality (Metrics 1-4)")
-    md.append(f"- **Build Success:** {metrics['build_success']}/{total} apps ({metrics['build_success']/total*100:.1f}%)")
-    md.append(f"- **Runtime Success:** {metrics['runtime_success']}/{total} apps ({metrics['runtime_success']/total*100:.1f}%)")
-    md.append(f"- **Type Safety:** {metrics['type_safety_pass']}/{total} apps pass ({metrics['type_safety_pass']/total*100:.1f}%)")
-    md.append(f"- **Tests Passing:** {metrics['tests_pass']}/{total} apps pass ({metrics['tests_pass']/total*100:.1f}%)")
-    md.append(f"- **Average Test Coverage:** {metrics['avg_coverage']:.1f}%")
+    w("### Core Functionality (Metrics 1-4)\n")
+    w(f"- **Build Success:** {metrics['build_success']}/{total} apps ({metrics['build_success'] * to_pct:.1f}%)\n")
+    w(f"- **Runtime Success:** {metrics['runtime_success']}/{total} apps ({metrics['runtime_success'] * to_pct:.1f}%)\n")
+    w(f"- **Type Safety:** {metrics['type_safety_pass']}/{total} apps pass ({metrics['type_safety_pass'] * to_pct:.1f}%)\n")
+    w(f"- **Tests Passing:** {metrics['tests_pass']}/{total} apps pass ({metrics['tests_pass'] * to_pct:.1f}%)\n")
+    w(f"- **Average Test Coverage:** {metrics['avg_coverage']:.1f}%\n")
 
-    md.append("\n### Databricks Integration (Metrics 5-6)")
-    md.append(f"- **Databricks Connectivity:** {metrics['databricks_connectivity']}/{total} apps ({metrics['databricks_connectivity']/total*100:.1f}%)")
-    md.append(f"- **Data Returned:** {metrics['data_returned']}/{total} apps ({metrics['data_returned']/total*100:.1f}%)")
+    w("\n### Databricks Integration (Metrics 5-6)\n")
+    w(f"- **Databricks Connectivity:** {metrics['databricks_connectivity']}/{total} apps ({metrics['databricks_connectivity'] * to_pct:.1f}%)\n")
+    w(f"- **Data Returned:** {metrics['data_returned']}/{total} apps ({metrics['data_returned'] * to_pct:.1f}%)\n")
 
-    md.append("\n### UI (Metric 7)")
-    md.append(f"- **UI Renders:** {metrics['ui_renders']}/{total} apps ({metrics['ui_renders']/total*100:.1f}%)")
+    w("\n### UI (Metric 7)\n")
+    w(f"- **UI Renders:** {metrics['ui_renders']}/{total} apps ({metrics['ui_renders'] * to_pct:.1f}%)\n")
 
-    md.append("\n### Developer Experience (Metrics 8-9)")
-    md.append(f"- **Average Local Runability:** {metrics['local_runability_avg']:.1f}/5 ⭐")
-    md.append(f"- **Average Deployability:** {metrics['deployability_avg']:.1f}/5 ⭐")
+    w("\n### Developer Experience (Metrics 8-9)\n")
+    w(f"- **Average Local Runability:** {metrics['local_runability_avg']:.1f}/5 ⭐\n")
+    w(f"- **Average Deployability:** {metrics['deployability_avg']:.1f}/5 ⭐\n")
 
-    md.append("\n### Code & Performance")
-    md.append(f"- **Total Lines of Code:** {metrics['total_loc']:,}")
-    md.append(f"- **Average LOC per App:** {metrics['avg_loc_per_app']:.0f}")
+    w("\n### Code & Performance\n")
+    w(f"- **Total Lines of Code:** {metrics['total_loc']:,}\n")
+    w(f"- **Average LOC per App:** {metrics['avg_loc_per_app']:.0f}\n")
     if metrics['avg_build_time'] > 0:
-        md.append(f"- **Average Build Time:** {metrics['avg_build_time']:.1f}s")
+        w(f"- **Average Build Time:** {metrics['avg_build_time']:.1f}s\n")
     if metrics['avg_startup_time'] > 0:
-        md.append(f"- **Average Startup Time:** {metrics['avg_startup_time']:.1f}s")
+        w(f"- **Average Startup Time:** {metrics['avg_startup_time']:.1f}s\n")
 
     # Generation Metrics (if available)
     if "generation_metrics" in summary and summary["generation_metrics"]["total_cost_usd"] > 0:
         gen = summary["generation_metrics"]
-        md.append("\n### AI Generation Metrics")
-        md.append(f"- **Total Cost:** ${gen['total_cost_usd']:.2f}")
-        md.append(f"- **Average Cost per App:** ${gen['avg_cost_usd']:.2f}")
-        md.append(f"- **Total Output Tokens:** {gen['total_output_tokens']:,}")
-        md.append(f"- **Average Output Tokens per App:** {gen['avg_output_tokens']:.0f}")
-        md.append(f"- **Average Turns per App:** {gen['avg_turns']:.0f}")
+        w("\n### AI Generation Metrics\n")
+        w(f"- **Total Cost:** ${gen['total_cost_usd']:.2f}\n")
+        w(f"- **Average Cost per App:** ${gen['avg_cost_usd']:.2f}\n")
+        w(f"- **Total Output Tokens:** {gen['total_output_tokens']:,}\n")
+        w(f"- **Average Output Tokens per App:** {gen['avg_output_tokens']:.0f}\n")
+        w(f"- **Average Turns per App:** {gen['avg_turns']:.0f}\n")
 
         # Calculate tokens per turn
         if gen['avg_turns'] > 0:
             tokens_per_turn = gen['avg_output_tokens'] / gen['avg_turns']
-            md.append(f"- **Average Output Tokens per Turn:** {tokens_per_turn:.0f}")
+            w(f"- **Average Output Tokens per Turn:** {tokens_per_turn:.0f}\n")
 
     # Quality Distribution
-    md.append("\n## Quality Distribution\n")
+    w("\n## Quality Distribution\n\n")
     qual = summary["quality_distribution"]
-    total = summary['total_apps']
-    md.append(f"- 🟢 **Excellent** (0 issues): {len(qual['excellent'])} apps ({len(qual['excellent'])/total*100:.1f}%)")
-    md.append(f"- 🟡 **Good** (1-2 issues): {len(qual['good'])} apps ({len(qual['good'])/total*100:.1f}%)")
-    md.append(f"- 🟠 **Fair** (3-4 issues): {len(qual['fair'])} apps ({len(qual['fair'])/total*100:.1f}%)")
-    md.append(f"- 🔴 **Poor** (5+ issues): {len(qual['poor'])} apps ({len(qual['poor'])/total*100:.1f}%)")
+    w(f"- 🟢 **Excellent** (0 issues): {len(qual['excellent'])} apps ({len(qual['excellent']) * to_pct:.1f}%)\n")
+    w(f"- 🟡 **Good** (1-2 issues): {len(qual['good'])} apps ({len(qual['good']) * to_pct:.1f}%)\n")
+    w(f"- 🟠 **Fair** (3-4 issues): {len(qual['fair'])} apps ({len(qual['fair']) * to_pct:.1f}%)\n")
+    w(f"- 🔴 **Poor** (5+ issues): {len(qual['poor'])} apps ({len(qual['poor']) * to_pct:.1f}%)\n")
 
     # Developer Experience Scores
-    md.append("\n## Developer Experience (DevX) Scores\n")
+    w("\n## Developer Experience (DevX) Scores\n\n")
     devx = summary["devx_scores"]
-    md.append(f"- ⭐⭐⭐⭐⭐ **Excellent**: {len(devx['5_stars'])} apps (local ≥4, deploy ≥4)")
-    md.append(f"- ⭐⭐⭐⭐ **Good**: {len(devx['4_stars'])} apps (local ≥3, deploy ≥3)")
-    md.append(f"- ⭐⭐⭐ **Fair**: {len(devx['3_stars'])} apps (local ≥2, deploy ≥2)")
-    md.append(f"- ⭐⭐ **Needs Work**: {len(devx['2_stars'])} apps")
+    w(f"- ⭐⭐⭐⭐⭐ **Excellent**: {len(devx['5_stars'])} apps (local ≥4, deploy ≥4)\n")
+    w(f"- ⭐⭐⭐⭐ **Good**: {len(devx['4_stars'])} apps (local ≥3, deploy ≥3)\n")
+    w(f"- ⭐⭐⭐ **Fair**: {len(devx['3_stars'])} apps (local ≥2, deploy ≥2)\n")
+    w(f"- ⭐⭐ **Needs Work**: {len(devx['2_stars'])} apps\n")
 
     # Common Issues
-    md.append("\n## Most Common Issues\n")
-    md.append("| Issue | Count | % of Apps |")
-    md.append("|-------|-------|-----------|")
+    w("\n## Most Common Issues\n\n")
+    w("| Issue | Count | % of Apps |\n")
+    w("|-------|-------|-----------|\n")
     for issue, count in summary["common_issues"].items():
-        pct = count / summary['total_apps'] * 100
-        md.append(f"| {issue} | {count} | {pct:.1f}% |")
+        pct = count * to_pct
+        w(f"| {issue} | {count} | {pct:.1f}% |\n")
 
     # Top Performers
-    md.append("\n## Top Performers\n")
+    w("\n## Top Performers\n\n")
 
     # Apps with no issues
     excellent = qual['excellent']
     if excellent:
-        md.append("\n### 🏆 Apps with Zero Issues\n")
-        for app in excellent[:10]:  # Top 10
-            md.append(f"- `{app}`")
+        w("\n### 🏆 Apps with Zero Issues\n\n")
+        w("".join(f"- `{app}`\n" for app in excellent[:10]))  # Top 10
 
     # Highest DevX scores
     top_devx = devx['5_stars']
     if top_devx:
-        md.append("\n### ⭐ Best Developer Experience\n")
-        for app in top_devx[:10]:
-            md.append(f"- `{app}`")
+        w("\n### ⭐ Best Developer Experience\n\n")
+        w("".join(f"- `{app}`\n" for app in top_devx[:10]))
 
     # Apps needing attention
-    md.append("\n## Apps Needing Attention\n")
+    w("\n## Apps Needing Attention\n\n")
     poor = qual['poor']
     if poor:
-        md.append("\n### 🔴 Apps with Most Issues\n")
+        w("\n### 🔴 Apps with Most Issues\n\n")
         # Sort by issue count
+        poor_set = set(poor)
         poor_sorted = sorted(
-            [(r["app_name"], len(r["issues"])) for r in results if r["app_name"] in poor],
-            key=lambda x: x[1],
+            [(app, issue_count) for app, issue_count in zip(cols.app_name, cols.issue_count) if app in poor_set],
+            key=itemgetter(1),
             reverse=True
         )
         for app, issue_count in poor_sorted[:10]:
-            md.append(f"- `{app}` ({issue_count} issues)")
+            w(f"- `{app}` ({issue_count} issues)\n")
 
     # Detailed breakdown by metric
-    md.append("\n## Detailed Metrics Breakdown\n")
+    w("\n## Detailed Metrics Breakdown\n\n")
 
     # Type Safety
-    md.append("\n### Type Safety\n")
-    type_fail = [r["app_name"] for r in results if not r["metrics"]["type_safety"]]
+    w("\n### Type Safety\n\n")
+    type_fail = [app for app, ok in zip(cols.app_name, cols.type_safety) if not ok]
     if type_fail:
-        md.append(f"\n**Failed ({len(type_fail)} apps):**")
-        for app in type_fail[:15]:
-            md.append(f"- `{app}`")
+        w(f"\n**Failed ({len(type_fail)} apps):**\n")
+        w("".join(f"- `{app}`\n" for app in type_fail[:15]))
         if len(type_fail) > 15:
-            md.append(f"- _{len(type_fail) - 15} more..._")
+            w(f"- _{len(type_fail) - 15} more..._\n")
 
     # Tests
-    md.append("\n### Tests\n")
-    test_fail = [r["app_name"] for r in results if not r["metrics"]["tests_pass"]]
+    w("\n### Tests\n\n")
+    test_fail = [app for app, ok in zip(cols.app_name, cols.tests_pass) if not ok]
     if test_fail:
-        md.append(f"\n**Failed ({len(test_fail)} apps):**")
-        for app in test_fail[:15]:
-            md.append(f"- `{app}`")
+        w(f"\n**Failed ({len(test_fail)} apps):**\n")
+        w("".join(f"- `{app}`\n" for app in test_fail[:15]))
         if len(test_fail) > 15:
-            md.append(f"- _{len(test_fail) - 15} more..._")
+            w(f"- _{len(test_fail) - 15} more..._\n")
 
     # Coverage distribution
     coverage_ranges = {
@@ -388,114 +554,147 @@ def generate_markdown_report(results: list[dict], summary: dict) -> str:
         "51-75%": 0,
         "76-100%": 0,
     }
-    for r in results:
-        cov = r["metrics"]["test_coverage_pct"]
-        if cov == 0:
-            coverage_ranges["0%"] += 1
-        elif cov <= 25:
-            coverage_ranges["1-25%"] += 1
-        elif cov <= 50:
-            coverage_ranges["26-50%"] += 1
-        elif cov <= 75:
-            coverage_ranges["51-75%"] += 1
-        else:
-            coverage_ranges["76-100%"] += 1
+    # Upper bounds of the buckets: 0 -> "0%", (0, 25] -> "1-25%", ..., >75 -> "76-100%"
+    coverage_edges = [0, 25, 50, 75]
+    if np is not None and cols.coverage:
+        # Bucket all coverage values in one vectorized call
+        cov = np.asarray(cols.coverage, dtype=np.float64)
+        bucket_counts = np.bincount(np.searchsorted(coverage_edges, cov, side="left"), minlength=5).tolist()
+    else:
+        buckets = Counter(bisect.bisect_left(coverage_edges, cov) for cov in cols.coverage)
+        bucket_counts = [buckets[i] for i in range(len(coverage_ranges))]
+    coverage_ranges.update(zip(coverage_ranges, bucket_counts))
 
-    md.append("\n**Coverage Distribution:**")
+    w("\n**Coverage Distribution:**\n")
     for range_name, count in coverage_ranges.items():
-        pct = count / summary['total_apps'] * 100 if summary['total_apps'] > 0 else 0
-        md.append(f"- {range_name}: {count} apps ({pct:.1f}%)")
-
-    # Local Runability Details
-    md.append("\n### Local Runability Details\n")
-    local_issues = defaultdict(int)
+        pct = count * to_pct
+        w(f"- {range_name}: {count} apps ({pct:.1f}%)\n")
+
+    # Scan each app's DevX details once for the breakdowns and recommendations
+    local_issues = Counter()
+    deploy_issues = Counter()
+    readme_missing = 0
+    healthcheck_missing = 0
     for r in results:
-        for detail in r["details"].get("local_runability", []):
-            if "✗" in detail:
-                local_issues[detail] += 1
+        local_details = r["details"].get("local_runability", ())
+        deploy_details = r["details"].get("deployability", ())
+        local_issues.update(detail for detail in local_details if "✗" in detail)
+        deploy_issues.update(detail for detail in deploy_details if "✗" in detail)
+        if any("No README.md" in detail for detail in local_details):
+            readme_missing += 1
+        if any("No HEALTHCHECK" in detail for detail in deploy_details):
+            healthcheck_missing += 1
 
+    # Local Runability Details
+    w("\n### Local Runability Details\n\n")
     if local_issues:
-        md.append("**Common local runability issues:**")
-        for issue, count in sorted(local_issues.items(), key=lambda x: x[1], reverse=True)[:5]:
-            md.append(f"- {issue}: {count} apps")
+        w("**Common local runability issues:**\n")
+        for issue, count in local_issues.most_common(5):
+            w(f"- {issue}: {count} apps\n")
 
     # Deployability Details
-    md.append("\n### Deployability Details\n")
-    deploy_issues = defaultdict(int)
-    for r in results:
-        for detail in r["details"].get("deployability", []):
-            if "✗" in detail:
-                deploy_issues[detail] += 1
-
+    w("\n### Deployability Details\n\n")
     if deploy_issues:
-        md.append("**Common deployability issues:**")
-        for issue, count in sorted(deploy_issues.items(), key=lambda x: x[1], reverse=True)[:5]:
-            md.append(f"- {issue}: {count} apps")
+        w("**Common deployability issues:**\n")
+        for issue, count in deploy_issues.most_common(5):
+            w(f"- {issue}: {count} apps\n")
 
     # Recommendations
-    md.append("\n## Recommendations\n")
+    w("\n## Recommendations\n\n")
 
-    type_fail_pct = (summary['total_apps'] - metrics['type_safety_pass']) / summary['total_apps'] * 100 if summary['total_apps'] > 0 else 0
-    test_fail_pct = (summary['total_apps'] - metrics['tests_pass']) / summary['total_apps'] * 100 if summary['total_apps'] > 0 else 0
+    type_fail_pct = (total - metrics['type_safety_pass']) * to_pct
+    test_fail_pct = (total - metrics['tests_pass']) * to_pct
 
     if type_fail_pct > 50:
-        md.append(f"\n### 🚨 CRITICAL: TypeScript Errors ({type_fail_pct:.0f}% of apps)")
-        md.append("- **Priority:** HIGH")
-        md.append("- **Action:** Review and fix TypeScript compilation errors across all apps")
-        md.append("- **Root cause:** Likely template or code generation issues")
+        w(f"\n### 🚨 CRITICAL: TypeScript Errors ({type_fail_pct:.0f}% of apps)\n")
+        w("- **Priority:** HIGH\n")
+        w("- **Action:** Review and fix TypeScript compilation errors across all apps\n")
+        w("- **Root cause:** Likely template or code generation issues\n")
 
     if test_fail_pct > 50:
-        md.append(f"\n### 🚨 CRITICAL: Test Failures ({test_fail_pct:.0f}% of apps)")
-        md.append("- **Priority:** HIGH")
-        md.append("- **Action:** Ensure tests run successfully")
-        md.append("- **Root cause:** May need environment setup or test configuration fixes")
+        w(f"\n### 🚨 CRITICAL: Test Failures ({test_fail_pct:.0f}% of apps)\n")
+        w("- **Priority:** HIGH\n")
+        w("- **Action:** Ensure tests run successfully\n")
+        w("- **Root cause:** May need environment setup or test configuration fixes\n")
 
     if metrics['avg_coverage'] < 50:
-        md.append(f"\n### ⚠️ WARNING: Low Test Coverage ({metrics['avg_coverage']:.0f}% average)")
-        md.append("- **Priority:** MEDIUM")
-        md.append("- **Action:** Improve test coverage across apps")
-        md.append("- **Target:** Aim for 70%+ coverage")
+        w(f"\n### ⚠️ WARNING: Low Test Coverage ({metrics['avg_coverage']:.0f}% average)\n")
+        w("- **Priority:** MEDIUM\n")
+        w("- **Action:** Improve test coverage across apps\n")
+        w("- **Target:** Aim for 70%+ coverage\n")
 
     # Check for common missing items
-    readme_missing = sum(1 for r in results if "No README.md" in str(r["details"].get("local_runability", [])))
-    if readme_missing > summary['total_apps'] * 0.7:
-        md.append(f"\n### 📝 Missing Documentation ({readme_missing} apps)")
-        md.append("- **Priority:** MEDIUM")
-        md.append("- **Action:** Auto-generate README.md for each app")
-        md.append("- **Content:** Setup instructions, environment variables, usage examples")
-
-    healthcheck_missing = sum(1 for r in results if "No HEALTHCHECK" in str(r["details"].get("deployability", [])))
-    if healthcheck_missing > summary['total_apps'] * 0.7:
-        md.append(f"\n### 🏥 Missing Health Checks ({healthcheck_missing} apps)")
-        md.append("- **Priority:** LOW")
-        md.append("- **Action:** Add HEALTHCHECK directive to Dockerfiles")
-        md.append("- **Benefit:** Better production monitoring and container orchestration")
+    if readme_missing > total * 0.7:
+        w(f"\n### 📝 Missing Documentation ({readme_missing} apps)\n")
+        w("- **Priority:** MEDIUM\n")
+        w("- **Action:** Auto-generate README.md for each app\n")
+        w("- **Content:** Setup instructions, environment variables, usage examples\n")
+
+    if healthcheck_missing > total * 0.7:
+        w(f"\n### 🏥 Missing Health Checks ({healthcheck_missing} apps)\n")
+        w("- **Priority:** LOW\n")
+        w("- **Action:** Add HEALTHCHECK directive to Dockerfiles\n")
+        w("- **Benefit:** Better production monitoring and container orchestration\n")
 
     # Positive highlights
-    md.append("\n## Highlights ✨\n")
+    w("\n## Highlights ✨\n\n")
 
     if metrics['deployability_avg'] >= 4:
-        md.append(f"- 🎉 **Strong deployability**: Average score of {metrics['deployability_avg']:.1f}/5")
+        w(f"- 🎉 **Strong deployability**: Average score of {metrics['deployability_avg']:.1f}/5\n")
 
     if metrics['local_runability_avg'] >= 3:
-        md.append(f"- 👍 **Good local development setup**: Average score of {metrics['local_runability_avg']:.1f}/5")
+        w(f"- 👍 **Good local development setup**: Average score of {metrics['local_runability_avg']:.1f}/5\n")
 
     if len(excellent) > 0:
-        md.append(f"- 🏆 **{len(excellent)} apps with zero issues** - excellent quality!")
+        w(f"- 🏆 **{len(excellent)} apps with zero issues** - excellent quality!\n")
 
     if metrics['avg_loc_per_app'] < 1000:
-        md.append(f"- 📦 **Concise codebase**: Average of {metrics['avg_loc_per_app']:.0f} LOC per app")
+        w(f"- 📦 **Concise codebase**: Average of {metrics['avg_loc_per_app']:.0f} LOC per app\n")
 
-    return "\n".join(md)
+    return buf.getvalue()
 
 
-def generate_csv_report(results: list[dict]) -> str:
-    """Generate CSV report with objective metrics only."""
-    import csv
-    from io import StringIO
+def _csv_rows(results: list[dict]):
+    """Yield one CSV row tuple per result (bools are ints, so int() gives the 0/1 columns)."""
+    b = int
+    for result in results:
+        metrics = result["metrics"]
+        issues = result["issues"]
+
+        yield (
+            result["app_name"],
+            result["timestamp"],
+            metrics.get("template_type", "unknown"),
+            # Metric 1-4
+            b(metrics["build_success"]),
+            b(metrics["runtime_success"]),
+            b(metrics["type_safety"]),
+            b(metrics["tests_pass"]),
+            f"{metrics['test_coverage_pct']:.1f}",
+            # Metric 5-6
+            b(metrics["databricks_connectivity"]),
+            b(metrics["data_returned"]),
+            # Metric 7
+            b(metrics["ui_renders"]),
+            # Metric 8-9
+            metrics["local_runability_score"],
+            metrics["deployability_score"],
+            # Composite score
+            f"{metrics['appeval_100']:.1f}",
+            # Metadata
+            f"{metrics['build_time_sec']:.1f}",
+            f"{metrics['startup_time_sec']:.1f}",
+            metrics["total_loc"],
+            b(metrics["has_dockerfile"]),
+            b(metrics["has_tests"]),
+            len(issues),
+            "; ".join(issues) if issues else "",
+        )
 
-    output = StringIO()
-    writer = csv.writer(output)
+
+def generate_csv_report(results: list[dict], out_path: Path) -> None:
+    """Write CSV report with objective metrics only, streaming rows to out_path."""
+    import csv
 
     # CSV Header - All 9 metrics from evals.md
     header = [
@@ -527,49 +726,17 @@ def generate_csv_report(results: list[dict]) -> str:
         "issue_count",
         "issues",
     ]
-    writer.writerow(header)
-
-    # Write data rows
-    for result in results:
-        metrics = result["metrics"]
-        issues = result["issues"]
-
-        row = [
-            result["app_name"],
-            result["timestamp"],
-            metrics.get("template_type", "unknown"),
-            # Metric 1-4
-            1 if metrics["build_success"] else 0,
-            1 if metrics["runtime_success"] else 0,
-            1 if metrics["type_safety"] else 0,
-            1 if metrics["tests_pass"] else 0,
-            f"{metrics['test_coverage_pct']:.1f}",
-            # Metric 5-6
-            1 if metrics["databricks_connectivity"] else 0,
-            1 if metrics["data_returned"] else 0,
-            # Metric 7
-            1 if metrics["ui_renders"] else 0,
-            # Metric 8-9
-            metrics["local_runability_score"],
-            metrics["deployability_score"],
-            # Composite score
-            f"{metrics['appeval_100']:.1f}",
-            # Metadata
-            f"{metrics['build_time_sec']:.1f}",
-            f"{metrics['startup_time_sec']:.1f}",
-            metrics["total_loc"],
-            1 if metrics["has_dockerfile"] else 0,
-            1 if metrics["has_tests"] else 0,
-            len(issues),
-            "; ".join(issues) if issues else "",
-        ]
-        writer.writerow(row)
+    with out_path.open("w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
 
-    return output.getvalue()
+        # Write data rows
+        writer.writerows(_csv_rows(results))
 
 
-def parse_args():
-    """Parse command-line arguments."""
+@functools.cache
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (constructed once per process)."""
     parser = argparse.ArgumentParser(
         description="Evaluate generated apps with 9 objective metrics",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -586,6 +753,7 @@ Examples:
   python evaluate_all.py --limit 10 --skip 5      # Evaluate 10 apps starting from 6th
   python evaluate_all.py -j 4                     # Evaluate 4 apps in parallel
   python evaluate_all.py -j 0                     # Auto-detect CPU count and parallelize
+  python evaluate_all.py --reuse-unchanged        # Only re-evaluate apps changed since the last --reuse-unchanged report
         """
     )
 
@@ -628,6 +796,14 @@ Examples:
         help='Model used (overrides value from bulk_run results)'
     )
 
+    parser.add_argument(
+        '--reuse-unchanged',
+        action='store_true',
+        help='Reuse results from the previous evaluation_report.json for apps whose files are unchanged, '
+             'judged by file size and mtime, and only if the evaluator itself is unchanged '
+             '(only results from an earlier --reuse-unchanged run carry the needed hashes)'
+    )
+
     filter_group = parser.add_argument_group('app filtering')
     filter_group.add_argument(
         '--apps',
@@ -659,11 +835,20 @@ Examples:
         help='Start evaluation from this app (inclusive)'
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    return build_parser().parse_args()
 
 
 def filter_app_dirs(app_dirs: list[Path], args) -> list[Path]:
-    """Filter app directories based on command-line arguments."""
+    """Filter app directories based on command-line arguments.
+
+    app_dirs must be sorted by name, as list_app_dirs() returns them; the
+    filters below keep that order, so --start-from can binary search it.
+    """
     filtered = app_dirs
 
     # Filter by specific app names
@@ -676,68 +861,144 @@ def filter_app_dirs(app_dirs: list[Path], args) -> list[Path]:
 
     # Filter by pattern
     if args.pattern:
-        filtered = [d for d in filtered if fnmatch.fnmatch(d.name, args.pattern)]
+        # Translate the glob once instead of once per directory name
+        matches_pattern = re.compile(fnmatch.translate(args.pattern)).match
+        filtered = [d for d in filtered if matches_pattern(d.name)]
         if not filtered:
             print(f"Warning: No apps found matching pattern: {args.pattern}")
             sys.exit(1)
 
     # Start from specific app
+    start_idx = 0
     if args.start_from:
-        start_idx = None
-        for i, d in enumerate(filtered):
-            if d.name == args.start_from:
-                start_idx = i
-                break
-
-        if start_idx is None:
+        names = [d.name for d in filtered]
+        start_idx = bisect.bisect_left(names, args.start_from)
+        if start_idx == len(names) or names[start_idx] != args.start_from:
             print(f"Warning: App '{args.start_from}' not found")
             sys.exit(1)
 
-        filtered = filtered[start_idx:]
-
     # Skip first N apps
     if args.skip:
-        if args.skip >= len(filtered):
-            print(f"Warning: --skip {args.skip} is >= total apps ({len(filtered)})")
+        remaining = len(filtered) - start_idx
+        if args.skip >= remaining:
+            print(f"Warning: --skip {args.skip} is >= total apps ({remaining})")
             sys.exit(1)
-        filtered = filtered[args.skip:]
+        start_idx += args.skip
 
-    # Limit to first N apps
-    if args.limit:
-        filtered = filtered[:args.limit]
+    # Limit to first N apps; start-from, skip and limit become one slice
+    end_idx = start_idx + args.limit if args.limit else len(filtered)
+    return filtered[start_idx:end_idx]
+
+
+def load_reusable_results(report_path: Path, fingerprints: dict[str, str]) -> dict[str, dict]:
+    """
+    Load results from a previous report whose app inputs are unchanged.
+
+    Args:
+        report_path: Previous evaluation_report.json
+        fingerprints: Current app_fingerprint() per app name
+
+    Returns:
+        Prior result dicts keyed by app name, for apps whose recorded
+        input_hash matches the current fingerprint. Empty if the report
+        was written by a different evaluator_version()
+    """
+    from evaluate_app import evaluator_version, json_loads
+
+    try:
+        prior = json_loads(report_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if prior.get("evaluator_version") != evaluator_version():
+        return {}
+    return {
+        r["app_name"]: r
+        for r in prior.get("apps", [])
+        if r.get("input_hash") is not None and fingerprints.get(r["app_name"]) == r["input_hash"]
+    }
 
-    return filtered
+
+class AdmissionController:
+    """
+    Concurrency limiter whose cap can shrink while evaluations are running.
+
+    Works like an asyncio.Semaphore, but the active count and cap live under an
+    asyncio.Condition so the cap can be changed at runtime. Every
+    `failure_threshold` failed evaluations the cap drops by one (never below 1),
+    shedding load when the Dagger engine is struggling (OOM, timeouts).
+    """
+
+    def __init__(self, cap: int, failure_threshold: int = 3):
+        self.cap = cap
+        self._active = 0
+        self._failures = 0
+        self._failure_threshold = failure_threshold
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.cap)
+            self._active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    async def set_cap(self, cap: int) -> None:
+        """Change the number of evaluations allowed to run at once."""
+        async with self._cond:
+            self.cap = max(1, cap)
+            self._cond.notify_all()
+
+    async def record(self, ok: bool) -> None:
+        """Count a finished evaluation; repeated failures lower the cap."""
+        if ok:
+            return
+        self._failures += 1
+        if self._failures % self._failure_threshold == 0 and self.cap > 1:
+            await self.set_cap(self.cap - 1)
+            print(f"⚠️  {self._failures} failed evaluations, reducing parallelism to {self.cap}")
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.release()
 
 
 async def evaluate_app_with_metadata_async(
-    client: dagger.Client,
+    client: "dagger.Client",
     app_dir: Path,
     prompt: str | None,
     gen_metrics: dict,
     index: int,
-    total: int
+    total: int,
 ) -> dict | None:
     """
     Async wrapper for evaluate_app_async that adds generation metrics and handles errors.
     Designed to work with asyncio.gather().
+
+    Every app runs in its own Dagger container and is reached through a
+    tunnel, so all evaluations use the default port. Keeping it fixed keeps
+    the workspace env, and so the install/build layer cache keys, stable.
     """
-    print(f"\n[{index}/{total}] {app_dir.name}")
+    from evaluate_app_dagger import evaluate_app_async
 
-    # Assign unique port for parallel execution to avoid Docker port conflicts
-    # Base port 8000 + index, supports up to ~60k parallel workers
-    port = 8000 + index
+    print(f"\n[{index}/{total}] {app_dir.name}")
 
     try:
-        result = await evaluate_app_async(client, app_dir, prompt, port)
-        result_dict = asdict(result)
+        result = await evaluate_app_async(client, app_dir, prompt)
+        result_dict = result.to_dict()
 
         # Add generation metrics if available
-        if app_dir.name in gen_metrics:
-            result_dict["generation_metrics"] = gen_metrics[app_dir.name]
+        gm = gen_metrics.get(app_dir.name)
+        if gm is not None:
+            result_dict["generation_metrics"] = gm
 
             # Calculate eff_units from generation_metrics if not already present
             if result_dict["metrics"].get("eff_units") is None:
-                gm = gen_metrics[app_dir.name]
                 tokens = gm.get("input_tokens", 0) + gm.get("output_tokens", 0)
                 result_dict["metrics"]["eff_units"] = eff_units(
                     tokens_used=tokens if tokens > 0 else None,
@@ -754,9 +1015,125 @@ async def evaluate_app_with_metadata_async(
         return None  # Return None for failed evaluations
 
 
+def format_console_summary(summary: dict) -> str:
+    """Render the end-of-run console summary (all 9 metrics) as one string."""
+    buf = StringIO()
+    w = buf.write
+    w("\n" + "=" * 60 + "\n")
+    w("EVALUATION SUMMARY - 9 OBJECTIVE METRICS\n")
+    w("=" * 60 + "\n")
+    metrics = summary["metrics_summary"]
+    total = summary['total_apps']
+
+    # Top-level metrics
+    w(f"\n📊 Overall Quality Score: {metrics['avg_appeval_100']:.1f}/100\n")
+    if metrics.get('avg_eff_units') is not None:
+        w(f"⚡ Average Efficiency:    {metrics['avg_eff_units']:.1f} units (lower is better)\n")
+
+    w("\nCore Functionality:\n")
+    w(f"  1. Build Success:         {metrics['build_success']}/{total} ({metrics['build_success']/total*100:.0f}%)\n")
+    w(f"  2. Runtime Success:       {metrics['runtime_success']}/{total} ({metrics['runtime_success']/total*100:.0f}%)\n")
+    w(f"  3. Type Safety:           {metrics['type_safety_pass']}/{total} ({metrics['type_safety_pass']/total*100:.0f}%)\n")
+    w(f"  4. Tests Pass:            {metrics['tests_pass']}/{total} ({metrics['tests_pass']/total*100:.0f}%)\n")
+    w(f"     Coverage:              {metrics['avg_coverage']:.1f}%\n")
+
+    w("\nDatabricks Integration:\n")
+    w(f"  5. DB Connectivity:       {metrics['databricks_connectivity']}/{total} ({metrics['databricks_connectivity']/total*100:.0f}%)\n")
+    w(f"  6. Data Returned:         {metrics['data_returned']}/{total} ({metrics['data_returned']/total*100:.0f}%)\n")
+
+    w("\nUI:\n")
+    w(f"  7. UI Renders:            {metrics['ui_renders']}/{total} ({metrics['ui_renders']/total*100:.0f}%)\n")
+
+    w("\nDeveloper Experience:\n")
+    w(f"  8. Local Runability:      {metrics['local_runability_avg']:.1f}/5 ⭐\n")
+    w(f"  9. Deployability:         {metrics['deployability_avg']:.1f}/5 ⭐\n")
+
+    w("\nQuality Distribution:\n")
+    qual = summary["quality_distribution"]
+    w(f"  🟢 Excellent: {len(qual['excellent'])}\n")
+    w(f"  🟡 Good:      {len(qual['good'])}\n")
+    w(f"  🟠 Fair:      {len(qual['fair'])}\n")
+    w(f"  🔴 Poor:      {len(qual['poor'])}\n")
+
+    return buf.getvalue()
+
+
+def log_to_mlflow(
+    full_report: dict,
+    artifacts: list[Path],
+    timestamp: str,
+    staging: bool,
+    run_config: dict[str, str],
+    git_hash: str | None,
+) -> None:
+    """
+    Log a finished evaluation run to MLflow.
+
+    Blocking (HTTP round-trips to the tracking server), so main_async runs it
+    in a worker thread alongside the console summary and HTML viewer.
+    """
+    print("\n📊 Logging to MLflow...")
+    try:
+        from mlflow_tracker import EvaluationTracker
+
+        # Determine experiment name based on --staging flag
+        experiment_name = "/Shared/edda-staging-evaluations" if staging else None
+
+        tracker = EvaluationTracker(experiment_name=experiment_name)
+        if tracker.enabled:
+            # Start MLflow run
+            run_name = f"eval-{timestamp}"
+            tags = {
+                "mode": "evaluation",
+                "environment": "staging" if staging else "production"
+            }
+
+            # Add git commit hash if available
+            if git_hash:
+                tags["git_commit"] = git_hash
+
+            run_id = tracker.start_run(run_name=run_name, tags=tags)
+
+            # Log parameters
+            params = {
+                "mode": "evaluation",
+                "total_apps": full_report["summary"]['total_apps'],
+                "timestamp": timestamp,
+                "model_version": "claude-sonnet-4-5-20250929",
+            }
+
+            # Add run config parameters if available
+            if run_config.get("mcp_binary"):
+                params["mcp_binary"] = run_config["mcp_binary"]
+            if run_config.get("backend"):
+                params["backend"] = run_config["backend"]
+            if run_config.get("model"):
+                params["llm_model"] = run_config["model"]
+
+            tracker.log_evaluation_parameters(**params)
+
+            # Log metrics from evaluation report
+            tracker.log_evaluation_metrics(full_report)
+
+            # Log artifacts
+            tracker.log_artifact_files([str(path) for path in artifacts])
+
+            # End run
+            tracker.end_run()
+
+            print("✓ MLflow tracking complete")
+            print(f"  Run ID: {run_id}")
+            print(f"  View: ML → Experiments → {tracker.experiment_name}")
+        else:
+            print("⚠️  MLflow tracking disabled (credentials not set)")
+    except Exception as e:
+        print(f"⚠️  MLflow tracking failed: {e}")
+
+
 async def main_async():
     """Async main entry point."""
     args = parse_args()
+    _load_env_once()
 
     script_dir = Path(__file__).parent
 
@@ -781,11 +1158,20 @@ async def main_async():
     if args.model:
         run_config["model"] = args.model
 
+    from evaluate_app import list_app_dirs
+
     # Get all app directories
-    all_app_dirs = [d for d in sorted(apps_dir.iterdir()) if d.is_dir() and not d.name.startswith(".")]
+    all_app_dirs = list_app_dirs(apps_dir)
 
     # Filter based on command-line arguments
     app_dirs = filter_app_dirs(all_app_dirs, args)
+    if not app_dirs:
+        print(f"Warning: No apps to evaluate in {apps_dir}")
+        sys.exit(1)
+
+    # Import the Dagger evaluation stack only once there is work to do
+    from evaluate_app import app_fingerprint, evaluator_version, json_dumps_bytes, write_json
+    from evaluate_app_dagger import close_client, get_client
 
     # Auto-detect CPU count if --parallel 0
     import os
@@ -797,6 +1183,16 @@ async def main_async():
         print(f"Error: --parallel must be >= 0 (got {args.parallel})")
         sys.exit(1)
 
+    # Clamp parallelism: never more workers than apps, and evaluations mostly wait
+    # on the Dagger engine, so allow up to min(32, 4 * CPUs) like ThreadPoolExecutor
+    if args.parallel > 1:
+        if args.parallel > cpu_count:
+            print(f"⚠️  Warning: Requested {args.parallel} parallel jobs but system has {cpu_count} CPUs")
+        max_parallel = max(1, min(len(app_dirs), 32, 4 * cpu_count))
+        if args.parallel > max_parallel:
+            print(f"🔧 Capping --parallel at {max_parallel} ({len(app_dirs)} apps, {cpu_count} CPUs)")
+            args.parallel = max_parallel
+
     print(f"🔍 Evaluating {len(app_dirs)} apps (out of {len(all_app_dirs)} total)...")
     print(f"   Directory: {apps_dir}")
     if args.apps:
@@ -813,239 +1209,193 @@ async def main_async():
         print(f"   Parallelism: {args.parallel} workers (Dagger containers)")
     print("=" * 60)
 
-    # Warn if parallelism is too high
-    if args.parallel > 1:
-        if args.parallel > cpu_count:
-            print(f"⚠️  Warning: Requested {args.parallel} parallel jobs but system has {cpu_count} CPUs")
-            print(f"   Consider using --parallel {cpu_count} for optimal performance")
-        if args.parallel > len(app_dirs):
-            print(f"⚠️  Warning: Using {args.parallel} workers for {len(app_dirs)} apps")
-            print(f"   Consider using --parallel {len(app_dirs)} to avoid idle workers")
-
     # Track timing
     eval_start_time = time.time()
 
-    # Run evaluations using Dagger with async/await
-    # Wrap in try-except to handle Dagger session cleanup timeout gracefully
-    import subprocess
+    # Determine output paths - save to app-eval directory
+    output_dir = script_dir.parent / "app-eval"
+    output_dir.mkdir(exist_ok=True)
+
+    # Fingerprint app inputs only when reuse is requested (it walks every app tree);
+    # those results record their hash so the next --reuse-unchanged run can match them
+    fingerprints = {}
+    reused = {}
+    if args.reuse_unchanged:
+        fingerprints = dict(zip(
+            (app_dir.name for app_dir in app_dirs),
+            await asyncio.gather(*(asyncio.to_thread(app_fingerprint, app_dir) for app_dir in app_dirs)),
+        ))
+        reused = load_reusable_results(output_dir / REPORT_JSON, fingerprints)
+        if reused:
+            print(f"♻️  Reusing previous results for {len(reused)} unchanged apps")
+    pending_dirs = [app_dir for app_dir in app_dirs if app_dir.name not in reused]
+
+    # Run evaluations using Dagger with async/await. The session stays open
+    # until the reports are written, so its slow cleanup does not delay them.
     results = []
+    client = await get_client()
+
+    # Resolve the commit hash in the background while the evaluations run;
+    # created just before the try so the finally always collects it
+    git_hash_task = asyncio.create_task(get_git_commit_hash_async())
+    mlflow_task = None
     try:
-        async with dagger.Connection() as client:
+        # Each result is appended as soon as it lands so an interrupted run keeps partial results
+        partial_output = output_dir / "evaluation_partial.jsonl"
+        with partial_output.open("wb") as partial:
+
+            def record(result_dict: dict | None) -> None:
+                if result_dict is None:
+                    return  # Failed evaluation
+                if fingerprints:
+                    result_dict["input_hash"] = fingerprints[result_dict["app_name"]]
+                results.append(result_dict)
+                partial.write(json_dumps_bytes(result_dict, indent=False) + b"\n")
+                partial.flush()
+
             if args.parallel > 1:
                 print(f"🚀 Running {args.parallel} evaluations in parallel (Dagger containers)...")
 
-                # Use asyncio.gather() for parallel execution with semaphore to limit concurrency
-                semaphore = asyncio.Semaphore(args.parallel)
+                # Admission limits concurrency; as_completed handles results in finishing order
+                admission = AdmissionController(args.parallel)
 
-                async def evaluate_with_semaphore(index, app_dir):
-                    async with semaphore:
-                        return await evaluate_app_with_metadata_async(
+                async def evaluate_admitted(index, app_dir):
+                    async with admission:
+                        result_dict = await evaluate_app_with_metadata_async(
                             client,
                             app_dir,
                             prompts.get(app_dir.name),
                             gen_metrics,
                             index,
-                            len(app_dirs)
+                            len(pending_dirs),
                         )
+                    await admission.record(result_dict is not None)
+                    return result_dict
 
-                results = await asyncio.gather(
-                    *[evaluate_with_semaphore(i, app_dir) for i, app_dir in enumerate(app_dirs, 1)],
-                    return_exceptions=False
-                )
-
-                # Filter out None results (failed evaluations)
-                results = [r for r in results if r is not None]
+                tasks = [asyncio.create_task(evaluate_admitted(i, app_dir)) for i, app_dir in enumerate(pending_dirs, 1)]
+                for next_done in asyncio.as_completed(tasks):
+                    record(await next_done)
 
             else:
                 # Sequential execution
                 print("🔄 Running evaluations sequentially (Dagger containers)...")
-                results = []
-                for i, app_dir in enumerate(app_dirs, 1):
-                    result_dict = await evaluate_app_with_metadata_async(
+                for i, app_dir in enumerate(pending_dirs, 1):
+                    record(await evaluate_app_with_metadata_async(
                         client,
                         app_dir,
                         prompts.get(app_dir.name),
                         gen_metrics,
                         i,
-                        len(app_dirs)
-                    )
-                    if result_dict is not None:
-                        results.append(result_dict)
-
-        # Warn about disconnection delay for large batches (Dagger has 5min hardcoded timeout)
-        if len(app_dirs) >= 5:
-            print("\n⏳ Disconnecting from Dagger (may take up to 5 minutes)...")
-
-    except subprocess.TimeoutExpired:
-        # Dagger session cleanup timed out, but evaluations completed successfully
-        # This is a known issue with Dagger SDK - the cleanup can take longer than the 300s timeout
-        print("\n⚠️  Warning: Dagger session cleanup timed out (this is expected for large batches)")
-        print("   All evaluations completed successfully, continuing with report generation...")
-
-    eval_duration = time.time() - eval_start_time
-
-    print("\n" + "=" * 60)
-    print(f"✅ Evaluated {len(results)}/{len(app_dirs)} apps in {eval_duration:.1f}s")
-    if args.parallel > 1:
-        estimated_sequential = eval_duration * args.parallel
-        print(f"   ⚡ Parallelization saved ~{estimated_sequential - eval_duration:.1f}s (speedup: {estimated_sequential/eval_duration:.1f}x)")
-
-    # Generate summary and report
-    print("\n📊 Generating summary report...")
-    summary = generate_summary_report(results)
-    markdown = generate_markdown_report(results, summary)
-
-    # Determine output paths - save to app-eval directory
-    output_dir = script_dir.parent / "app-eval"
-    output_dir.mkdir(exist_ok=True)
-
-    # Rename existing evaluation files before creating new ones
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    old_files = [
-        (output_dir / "evaluation_report.json", f"evaluation_report_{timestamp}.json"),
-        (output_dir / "evaluation_report.csv", f"evaluation_report_{timestamp}.csv"),
-        (output_dir / "EVALUATION_REPORT.md", f"EVALUATION_REPORT_{timestamp}.md"),
-    ]
-
-    for old_file, new_name in old_files:
-        if old_file.exists():
-            renamed = old_file.parent / new_name
-            old_file.rename(renamed)
+                        len(pending_dirs),
+                    ))
+
+            for result_dict in reused.values():
+                record(result_dict)
+
+        # Reports list apps in name order regardless of completion order or reuse
+        results.sort(key=itemgetter("app_name"))
+
+        eval_duration = time.time() - eval_start_time
+
+        print("\n" + "=" * 60)
+        print(f"✅ Evaluated {len(results)}/{len(app_dirs)} apps in {eval_duration:.1f}s")
+        if args.parallel > 1:
+            estimated_sequential = eval_duration * args.parallel
+            print(f"   ⚡ Parallelization saved ~{estimated_sequential - eval_duration:.1f}s (speedup: {estimated_sequential/eval_duration:.1f}x)")
+
+        # Generate summary and report
+        print("\n📊 Generating summary report...")
+        # One clock reading for the whole run so every report carries the same time
+        run_time = time.time()
+        run_ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(run_time))
+        summary = generate_summary_report(results, run_ts)
+
+        # Rename existing evaluation files before creating new ones
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(run_time))
+        json_output, csv_output, md_output = (output_dir / name for name in (REPORT_JSON, REPORT_CSV, REPORT_MD))
+
+        for old_file in (json_output, csv_output, md_output):
+            new_name = f"{old_file.stem}_{timestamp}{old_file.suffix}"
+            # Rename directly instead of probing with exists() first
+            try:
+                old_file.rename(old_file.with_name(new_name))
+            except FileNotFoundError:
+                continue
             print(f"  Preserved: {old_file.name} → {new_name}")
 
-    json_output = output_dir / "evaluation_report.json"
-    md_output = output_dir / "EVALUATION_REPORT.md"
-
-    # Save full results
-    full_report = {
-        "summary": summary,
-        "apps": results,
-        "timestamp": timestamp,
-        "evaluation_run_id": timestamp,
-    }
-    json_output.write_text(json.dumps(full_report, indent=2))
-    print(f"✓ JSON report saved: {json_output}")
-
-    # Save markdown report
-    md_output.write_text(markdown)
-    print(f"✓ Markdown report saved: {md_output}")
-
-    # Save CSV report
-    csv_output = output_dir / "evaluation_report.csv"
-    csv_content = generate_csv_report(results)
-    csv_output.write_text(csv_content)
-    print(f"✓ CSV report saved: {csv_output}")
-
-    # Log to MLflow
-    print("\n📊 Logging to MLflow...")
-    try:
-        from mlflow_tracker import EvaluationTracker
-
-        # Determine experiment name based on --staging flag
-        experiment_name = "/Shared/edda-staging-evaluations" if args.staging else None
-
-        tracker = EvaluationTracker(experiment_name=experiment_name)
-        if tracker.enabled:
-            # Start MLflow run
-            run_name = f"eval-{timestamp}"
-            tags = {
-                "mode": "evaluation",
-                "environment": "staging" if args.staging else "production"
-            }
-
-            # Add git commit hash if available
-            git_hash = get_git_commit_hash()
-            if git_hash:
-                tags["git_commit"] = git_hash
-
-            run_id = tracker.start_run(run_name=run_name, tags=tags)
-
-            # Log parameters
-            params = {
-                "mode": "evaluation",
-                "total_apps": summary['total_apps'],
-                "timestamp": timestamp,
-                "model_version": "claude-sonnet-4-5-20250929",
-            }
-
-            # Add run config parameters if available
-            if run_config.get("mcp_binary"):
-                params["mcp_binary"] = run_config["mcp_binary"]
-            if run_config.get("backend"):
-                params["backend"] = run_config["backend"]
-            if run_config.get("model"):
-                params["llm_model"] = run_config["model"]
-
-            tracker.log_evaluation_parameters(**params)
-
-            # Log metrics from evaluation report
-            tracker.log_evaluation_metrics(full_report)
-
-            # Log artifacts
-            tracker.log_artifact_file(str(json_output))
-            tracker.log_artifact_file(str(md_output))
-            tracker.log_artifact_file(str(csv_output))
-
-            # End run
-            tracker.end_run()
-
-            print("✓ MLflow tracking complete")
-            print(f"  Run ID: {run_id}")
-            print(f"  View: ML → Experiments → {tracker.experiment_name}")
-        else:
-            print("⚠️  MLflow tracking disabled (credentials not set)")
-    except Exception as e:
-        print(f"⚠️  MLflow tracking failed: {e}")
-
-    # Print summary to console - All 9 metrics
-    print("\n" + "=" * 60)
-    print("EVALUATION SUMMARY - 9 OBJECTIVE METRICS")
-    print("=" * 60)
-    metrics = summary["metrics_summary"]
-    total = summary['total_apps']
-
-    # Top-level metrics
-    print(f"\n📊 Overall Quality Score: {metrics['avg_appeval_100']:.1f}/100")
-    if metrics.get('avg_eff_units') is not None:
-        print(f"⚡ Average Efficiency:    {metrics['avg_eff_units']:.1f} units (lower is better)")
-
-    print("\nCore Functionality:")
-    print(f"  1. Build Success:         {metrics['build_success']}/{total} ({metrics['build_success']/total*100:.0f}%)")
-    print(f"  2. Runtime Success:       {metrics['runtime_success']}/{total} ({metrics['runtime_success']/total*100:.0f}%)")
-    print(f"  3. Type Safety:           {metrics['type_safety_pass']}/{total} ({metrics['type_safety_pass']/total*100:.0f}%)")
-    print(f"  4. Tests Pass:            {metrics['tests_pass']}/{total} ({metrics['tests_pass']/total*100:.0f}%)")
-    print(f"     Coverage:              {metrics['avg_coverage']:.1f}%")
+        full_report = {
+            "summary": summary,
+            "apps": results,
+            "timestamp": timestamp,
+            "evaluation_run_id": timestamp,
+        }
+        if fingerprints:
+            full_report["evaluator_version"] = evaluator_version()
+
+        # The three reports only read results/summary, so they are written concurrently
+        def write_markdown():
+            md_output.write_text(generate_markdown_report(results, summary, to_columns(results)))
+
+        await asyncio.gather(
+            asyncio.to_thread(write_json, json_output, full_report),
+            asyncio.to_thread(write_markdown),
+            asyncio.to_thread(generate_csv_report, results, csv_output),
+        )
+        print(f"✓ JSON report saved: {json_output}")
+        print(f"✓ Markdown report saved: {md_output}")
+        print(f"✓ CSV report saved: {csv_output}")
+
+        # Log to MLflow in a worker thread; awaited after the HTML viewer is generated
+        git_hash = await git_hash_task
+        mlflow_task = asyncio.create_task(asyncio.to_thread(
+            log_to_mlflow,
+            full_report,
+            [json_output, md_output, csv_output],
+            timestamp,
+            args.staging,
+            run_config,
+            git_hash,
+        ))
+
+        # Generate interactive HTML viewer in a worker thread while the summary prints
+        html_output = output_dir / "evaluation_viewer.html"
 
-    print("\nDatabricks Integration:")
-    print(f"  5. DB Connectivity:       {metrics['databricks_connectivity']}/{total} ({metrics['databricks_connectivity']/total*100:.0f}%)")
-    print(f"  6. Data Returned:         {metrics['data_returned']}/{total} ({metrics['data_returned']/total*100:.0f}%)")
+        def write_html_viewer():
+            from generate_eval_viewer import generate_html_viewer
+            generate_html_viewer(json_output, html_output, data=full_report)
 
-    print("\nUI:")
-    print(f"  7. UI Renders:            {metrics['ui_renders']}/{total} ({metrics['ui_renders']/total*100:.0f}%)")
+        html_task = asyncio.create_task(asyncio.to_thread(write_html_viewer))
 
-    print("\nDeveloper Experience:")
-    print(f"  8. Local Runability:      {metrics['local_runability_avg']:.1f}/5 ⭐")
-    print(f"  9. Deployability:         {metrics['deployability_avg']:.1f}/5 ⭐")
+        # Print summary to console - All 9 metrics, in a single write
+        sys.stdout.write(format_console_summary(summary))
+        sys.stdout.flush()
 
-    print("\nQuality Distribution:")
-    qual = summary["quality_distribution"]
-    print(f"  🟢 Excellent: {len(qual['excellent'])}")
-    print(f"  🟡 Good:      {len(qual['good'])}")
-    print(f"  🟠 Fair:      {len(qual['fair'])}")
-    print(f"  🔴 Poor:      {len(qual['poor'])}")
+        print(f"\n📄 Full report: {md_output}")
 
-    print(f"\n📄 Full report: {md_output}")
+        print("\n🌐 Generating interactive HTML viewer...")
+        try:
+            await html_task
+            print(f"✓ HTML viewer: {html_output}")
+            print(f"\n🎉 Open in browser: file://{html_output.absolute()}")
+        except Exception as e:
+            print(f"⚠️  Could not generate HTML viewer: {e}")
 
-    # Generate interactive HTML viewer
-    print("\n🌐 Generating interactive HTML viewer...")
-    try:
-        from generate_eval_viewer import generate_html_viewer
-        html_output = output_dir / "evaluation_viewer.html"
-        generate_html_viewer(json_output, html_output)
-        print(f"✓ HTML viewer: {html_output}")
-        print(f"\n🎉 Open in browser: file://{html_output.absolute()}")
-    except Exception as e:
-        print(f"⚠️  Could not generate HTML viewer: {e}")
+    finally:
+        # Disconnect last, even if evaluation or reporting failed; the MLflow
+        # upload keeps running in its thread meanwhile
+        if len(app_dirs) >= 5:
+            # Dagger has a 5min hardcoded cleanup timeout
+            print("\n⏳ Disconnecting from Dagger (may take up to 5 minutes)...")
+        try:
+            await close_client()
+        except subprocess.TimeoutExpired:
+            # This is a known issue with Dagger SDK - the cleanup can take longer than the 300s timeout
+            print("\n⚠️  Warning: Dagger session cleanup timed out (this is expected for large batches)")
+
+        # Bounded by its own 5s timeout; awaiting reaps the git process on every path
+        await git_hash_task
+        if mlflow_task is not None:
+            await mlflow_task
 
 
 def main():
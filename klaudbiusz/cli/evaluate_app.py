@@ -13,14 +13,38 @@ Runs 7 core metrics checks:
 Usage:
     python evaluate_app.py <app_directory>
     python evaluate_app.py --all  # Evaluate all apps in ../app/
+    python evaluate_app.py --all --batch-llm  # Run all LLM/VLM checks as one batch job
+    python evaluate_app.py --all --jobs 8  # Evaluate 8 apps at a time (default: min(4, CPUs))
+
+With --all --batch-llm, the LLM/VLM checks of every app are submitted as one
+Message Batches job after the other metrics finish (half the price of
+individual calls, but results arrive only when the whole batch ends). A batch
+still running after LLM_BATCH_TIMEOUT_SEC is cancelled and the checks fall
+back to individual calls.
 """
 
+import asyncio
+import base64
+import contextlib
+import fnmatch
+import functools
+import hashlib
+import io
 import json
+import multiprocessing
 import os
+import pickle
+import re
+import signal
+import socket
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import asdict, dataclass
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any
 
@@ -45,11 +69,64 @@ try:
 except ImportError:
     anthropic = None
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 from eval_metrics import calculate_appeval_100, eff_units
 from eval_checks import check_databricks_connectivity as _check_db_connectivity, extract_sql_queries
 from template_detection import detect_template
 
+# On-disk cache for LLM/VLM responses, keyed on model + prompt + image content
+LLM_CACHE_DIR = Path.home() / ".cache" / "eval_app"
+
+# Dependency, VCS and build output directories never counted as app source
+_PRUNED_DIRS = frozenset({"node_modules", ".git", "dist", "build", ".next"})
+
+# Evaluator sources whose changes invalidate results reused by --reuse-unchanged
+_EVALUATOR_SOURCES = (
+    "evaluate_app.py",
+    "evaluate_app_dagger.py",
+    "eval_checks.py",
+    "eval_metrics.py",
+    "template_detection.py",
+    "ts_workspace.py",
+    "dagger_utils.py",
+)
 
+# Coverage summary row from the test runner, e.g. "# all files |  85.50 | ..."
+_COV_RE = re.compile(r"(?im)^[^|\n]*all files[^|\n]*\|\s*([\d.]+)\s*%?")
+
+
+def parse_coverage_pct(*outputs: str) -> float:
+    """Extract the overall line coverage percentage from test output (0.0 if absent).
+
+    When several summaries are printed (e.g. server then client) the last one
+    wins. Multiple streams (e.g. stdout and stderr) are treated as if joined
+    in order, without concatenating them first.
+    """
+    for output in reversed(outputs):
+        matches = _COV_RE.findall(output)
+        if matches:
+            try:
+                return float(matches[-1])
+            except ValueError:
+                pass
+    return 0.0
+
+
+@functools.lru_cache(maxsize=512)
 def get_backend_dir(app_dir: Path, template: str) -> Path:
     """Get backend directory based on template type."""
     if template == "dbx-sdk":
@@ -71,6 +148,7 @@ def get_backend_dir(app_dir: Path, template: str) -> Path:
     return app_dir / "backend"
 
 
+@functools.lru_cache(maxsize=512)
 def get_frontend_dir(app_dir: Path, template: str) -> Path:
     """Get frontend directory based on template type."""
     if template == "dbx-sdk":
@@ -92,7 +170,25 @@ def get_frontend_dir(app_dir: Path, template: str) -> Path:
     return app_dir / "frontend"
 
 
-@dataclass
+# Templates with their own start/stop/typecheck/test scripts under cli/eval/
+_SCRIPT_DIR_BY_TEMPLATE = {"dbx-sdk": "dbx-sdk", "trpc": "trpc"}
+
+
+@functools.lru_cache(maxsize=512)
+def _pick_script_dir(app_dir: Path, template: str, prefer_docker: bool) -> str | None:
+    """Pick the cli/eval/ script directory for an app, or None if there is none.
+
+    Apps with a Dockerfile use the docker scripts; prefer_docker decides
+    whether that wins over the template's own scripts (runtime/stop) or only
+    serves as the fallback (typecheck/tests).
+    """
+    has_dockerfile = (app_dir / "Dockerfile").exists()
+    if prefer_docker and has_dockerfile:
+        return "docker"
+    return _SCRIPT_DIR_BY_TEMPLATE.get(template, "docker" if has_dockerfile else None)
+
+
+@dataclass(slots=True)
 class FullMetrics:
     """All 9 metrics from evals.md."""
     # Core functionality (Binary)
@@ -130,7 +226,11 @@ class FullMetrics:
     template_type: str = "unknown"
 
 
-@dataclass
+# Field names resolved once instead of introspecting on every to_dict() call
+_METRIC_FIELDS = tuple(f.name for f in fields(FullMetrics))
+
+
+@dataclass(slots=True)
 class EvalResult:
     """Full evaluation result for an app."""
 
@@ -141,46 +241,234 @@ class EvalResult:
     issues: list[str]
     details: dict[str, Any]
 
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready dict; a flat projection instead of asdict()'s recursive deep copy."""
+        return {
+            "app_name": self.app_name,
+            "app_dir": self.app_dir,
+            "timestamp": self.timestamp,
+            "metrics": {name: getattr(self.metrics, name) for name in _METRIC_FIELDS},
+            "issues": list(self.issues),
+            "details": dict(self.details),
+        }
+
+
+def json_dumps_bytes(data: Any, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode()
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write indented JSON to path without building the whole document as a str.
+
+    orjson encodes straight to bytes; the stdlib fallback streams chunks from
+    json.dump into a buffered file handle.
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with path.open("w", buffering=1 << 20) as f:
+        json.dump(data, f, indent=2)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Concurrent `docker build`s allowed across --all workers; more just thrash the daemon
+DOCKER_BUILD_SLOTS = 2
+
+# Set in --all worker processes by _init_worker; None means builds are not gated
+_docker_slots = None
+
 
-def run_command(cmd: list[str], cwd: str | None = None, timeout: int = 300, env: dict[str, str] | None = None) -> tuple[bool, str, str]:
-    """Run a shell command and return (success, stdout, stderr)."""
+def _init_worker(docker_slots) -> None:
+    """ProcessPoolExecutor initializer sharing the docker build semaphore with a worker."""
+    global _docker_slots
+    _docker_slots = docker_slots
+
+
+def find_free_port() -> int:
+    """Ask the OS for a currently unused TCP port on the host."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("", 0))
+        return sock.getsockname()[1]
+
+
+def _kill_process_group(proc: subprocess.Popen) -> None:
+    """Kill a process started with start_new_session=True and all its children."""
     try:
-        result = subprocess.run(
+        os.killpg(os.getpgid(proc.pid), signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+    proc.wait()
+
+
+def run_command(
+    cmd: list[str],
+    cwd: str | None = None,
+    timeout: int = 300,
+    env: dict[str, str] | None = None,
+    capture_stdout: bool = True,
+) -> tuple[bool, str, str]:
+    """Run a shell command and return (success, stdout, stderr).
+
+    The command runs in its own process group so that on timeout the whole
+    tree (npm -> node/tsc) is killed rather than left running. With
+    ``capture_stdout=False`` stdout goes to /dev/null and "" is returned
+    for it, so only stderr is buffered.
+    """
+    try:
+        proc = subprocess.Popen(
             cmd,
             cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
             env=env,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            start_new_session=True,
         )
-        return result.returncode == 0, result.stdout, result.stderr
+    except Exception as e:
+        return False, "", str(e)
+
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+        return proc.returncode == 0, stdout or "", stderr
     except subprocess.TimeoutExpired:
+        _kill_process_group(proc)
         return False, "", "Command timed out"
     except Exception as e:
+        _kill_process_group(proc)
         return False, "", str(e)
 
 
+def run_command_streamed(
+    cmd: list[str],
+    cwd: str | None = None,
+    timeout: int = 300,
+    env: dict[str, str] | None = None,
+    tail_bytes: int = 65536,
+) -> tuple[bool, str]:
+    """Run a command, streaming merged stdout/stderr line by line.
+
+    Only the last ``tail_bytes`` of output are kept, so chatty builds don't
+    buffer megabytes of logs in memory. Returns (success, output_tail).
+    """
+    tail: deque[str] = deque()
+    tail_size = 0
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            start_new_session=True,
+        )
+    except Exception as e:
+        return False, str(e)
+
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        _kill_process_group(proc)
+
+    timer = threading.Timer(timeout, _kill)
+    timer.start()
+    try:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            tail.append(line)
+            tail_size += len(line)
+            while tail_size > tail_bytes and len(tail) > 1:
+                tail_size -= len(tail.popleft())
+        proc.wait()
+    finally:
+        timer.cancel()
+
+    if timed_out.is_set():
+        return False, "Command timed out"
+    return proc.returncode == 0, "".join(tail)
+
+
+def run_command_rc(
+    cmd: list[str],
+    cwd: str | None = None,
+    timeout: int = 300,
+    env: dict[str, str] | None = None,
+    input: bytes | None = None,
+) -> bool:
+    """Run a command for its exit status only (output is discarded, never decoded).
+
+    ``input`` is written to the command's stdin. Like run_command, the whole
+    process group is killed on timeout.
+    """
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except Exception:
+        return False
+
+    try:
+        proc.communicate(input=input, timeout=timeout)
+        return proc.returncode == 0
+    except subprocess.TimeoutExpired:
+        _kill_process_group(proc)
+        return False
+
+
+# Seconds allowed for the app's docker build / npm run build
+_DOCKER_BUILD_TIMEOUT = 300
+_NPM_BUILD_TIMEOUT = 300
+
+
 def check_build_success(app_dir: Path, template: str = "unknown") -> tuple[bool, dict]:
     """Metric 1: Build succeeds - creates deployment artifacts (frontend build)."""
     print("  [1/7] Checking build success...")
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     dockerfile = app_dir / "Dockerfile"
     has_dockerfile = dockerfile.exists()
 
     if has_dockerfile:
-        # Docker-based build (comprehensive build including backend + frontend)
-        success, _stdout, _stderr = run_command(
-            ["docker", "build", "-t", f"eval-{app_dir.name}", "."],
-            cwd=str(app_dir),
-            timeout=300,
-        )
-        build_time = time.time() - start_time
+        # Docker-based build (comprehensive build including backend + frontend).
+        # BuildKit with inline cache metadata lets the previous eval image of this
+        # app seed the layer cache, so unchanged npm install/tsc layers are reused.
+        image = f"eval-{app_dir.name}"
+        with _docker_slots or contextlib.nullcontext():
+            # Timed from here so waiting for a build slot isn't counted as build time
+            start_time = time.perf_counter()
+            success, _ = run_command_streamed(
+                [
+                    "docker", "build",
+                    "--cache-from", image,
+                    "--build-arg", "BUILDKIT_INLINE_CACHE=1",
+                    "-t", image,
+                    ".",
+                ],
+                cwd=str(app_dir),
+                timeout=_DOCKER_BUILD_TIMEOUT,
+                env={**os.environ, "DOCKER_BUILDKIT": "1"},
+            )
+            build_time = time.perf_counter() - start_time
         return success, {"build_time_sec": round(build_time, 1), "has_dockerfile": True}
 
     # Non-Docker build: build frontend
-    import json
-
     if template == "dbx-sdk":
         # DBX SDK: root package.json with backend/ directory
         package_json = app_dir / "package.json"
@@ -195,10 +483,10 @@ def check_build_success(app_dir: Path, template: str = "unknown") -> tuple[bool,
 
         # Build frontend using npm run build
         if "build" in scripts:
-            success, _, _ = run_command(
+            success, _ = run_command_streamed(
                 ["npm", "run", "build"],
                 cwd=str(app_dir),
-                timeout=300,
+                timeout=_NPM_BUILD_TIMEOUT,
             )
         else:
             # No build script - failure for production apps
@@ -215,10 +503,10 @@ def check_build_success(app_dir: Path, template: str = "unknown") -> tuple[bool,
                 client_pkg = json.loads((client_dir / "package.json").read_text())
                 has_build = "build" in client_pkg.get("scripts", {})
                 if has_build:
-                    success, _, _ = run_command(
+                    success, _ = run_command_streamed(
                         ["npm", "run", "build"],
                         cwd=str(client_dir),
-                        timeout=300,
+                        timeout=_NPM_BUILD_TIMEOUT,
                     )
                 else:
                     # No build script in client package.json
@@ -229,7 +517,7 @@ def check_build_success(app_dir: Path, template: str = "unknown") -> tuple[bool,
             # No client directory or package.json - fail
             success = False
 
-    build_time = time.time() - start_time
+    build_time = time.perf_counter() - start_time
     return success, {"build_time_sec": round(build_time, 1), "has_dockerfile": False}
 
 
@@ -246,7 +534,8 @@ def _prepare_runtime_env(app_dir: Path, container_name: str = "", port: int = 80
     env.setdefault("DATABRICKS_CLIENT_SECRET", "eval-mock-client-secret")
     env.setdefault("DATABRICKS_APP_NAME", app_dir.name)
     env.setdefault("DATABRICKS_WAREHOUSE_ID", "")
-    env.setdefault("DATABRICKS_APP_PORT", str(port))
+    # Always the per-app port, so concurrent --all evals never share one
+    env["DATABRICKS_APP_PORT"] = str(port)
     env.setdefault("FLASK_RUN_HOST", "0.0.0.0")
 
     # Container name for docker scripts
@@ -267,17 +556,10 @@ def check_runtime_success(app_dir: Path, container_name: str, template: str = "u
     # Clean up any existing processes/containers before starting
     _stop_app(app_dir, template, port)
 
-    dockerfile = app_dir / "Dockerfile"
-
     try:
         # Determine which template script to use
-        if dockerfile.exists():
-            script_dir = "docker"
-        elif template == "dbx-sdk":
-            script_dir = "dbx-sdk"
-        elif template == "trpc":
-            script_dir = "trpc"
-        else:
+        script_dir = _pick_script_dir(app_dir, template, prefer_docker=True)
+        if script_dir is None:
             # Unknown template - fail with clear error
             print(f"  ⚠️  Unknown template: {template}")
             return False, {}
@@ -295,14 +577,15 @@ def check_runtime_success(app_dir: Path, container_name: str, template: str = "u
             return False, {}
 
         # Run start script (includes startup, waiting, and health check)
-        start_time = time.time()
+        start_time = time.perf_counter()
         success, _, stderr = run_command(
             ["bash", str(start_script)],
             cwd=str(app_dir),
             env=env,
             timeout=30,  # Max 30 seconds for start + health check
+            capture_stdout=False,
         )
-        startup_time = time.time() - start_time
+        startup_time = time.perf_counter() - start_time
 
         # Cleanup regardless of success/failure
         _stop_app(app_dir, template, port)
@@ -319,69 +602,105 @@ def check_runtime_success(app_dir: Path, container_name: str, template: str = "u
 
     except Exception as e:
         # Ensure cleanup on any exception
-        _stop_app(app_dir, template)
+        _stop_app(app_dir, template, port)
         print(f"  ⚠️  Exception during runtime check: {e}")
         return False, {}
 
 
+def _kill_port_listeners(port: int) -> None:
+    """Kill whatever processes hold a TCP socket on the given local port.
+
+    With psutil the lookup runs in-process and returns as soon as the
+    processes are gone; otherwise falls back to lsof | xargs kill.
+    """
+    if psutil is not None:
+        try:
+            pids = {c.pid for c in psutil.net_connections(kind="tcp") if c.pid and c.laddr and c.laddr.port == port}
+            procs = []
+            for pid in pids:
+                try:
+                    proc = psutil.Process(pid)
+                    proc.kill()
+                    procs.append(proc)
+                except psutil.Error:
+                    pass
+            psutil.wait_procs(procs, timeout=2)
+            return
+        except psutil.AccessDenied:
+            pass  # net_connections needs privileges on some platforms
+
+    run_command_rc(["bash", "-c", f"lsof -ti:{port} | xargs kill -9 2>/dev/null || true"], timeout=5)
+    _wait_port_free(port)
+
+
+def _wait_port_free(port: int, timeout: float = 1.0, poll_interval: float = 0.05) -> bool:
+    """Wait until nothing listens on the port any more (at most timeout seconds).
+
+    Replaces a fixed sleep after stopping an app: returns as soon as the
+    port can be bound again.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind(("", port))
+                return True
+            except OSError:
+                pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(poll_interval)
+
+
 def _stop_app(app_dir: Path, template: str = "unknown", port: int = 8000) -> bool:
     """Stop app using template-specific stop.sh script."""
     try:
-        # Determine which template script to use
-        dockerfile = app_dir / "Dockerfile"
-        if dockerfile.exists():
-            script_dir = "docker"
-        elif template == "dbx-sdk":
-            script_dir = "dbx-sdk"
-        elif template == "trpc":
-            script_dir = "trpc"
-        else:
-            # Unknown template - try manual cleanup
-            script_dir = None
+        # Determine which template script to use (None: unknown template, manual cleanup)
+        script_dir = _pick_script_dir(app_dir, template, prefer_docker=True)
 
         # Use template-specific stop script
         if script_dir:
             stop_script = Path(__file__).parent / "eval" / script_dir / "stop.sh"
             if stop_script.exists():
-                success, _, _ = run_command(
+                # The scripts only stop the app on this port, leaving parallel evals alone
+                success = run_command_rc(
                     ["bash", str(stop_script)],
                     cwd=str(app_dir),
                     timeout=10,
+                    env={**os.environ, "DATABRICKS_APP_PORT": str(port)},
                 )
-                time.sleep(1)  # Give the OS time to release resources
+                _wait_port_free(port)  # Give the OS time to release resources
                 return success
 
         # Fallback to manual cleanup
-        subprocess.run(
-            ["bash", "-c", f"lsof -ti:{port} | xargs kill -9 2>/dev/null || true"],
-            capture_output=True,
-            timeout=5,
-        )
-        time.sleep(1)
+        _kill_port_listeners(port)
         return True
     except Exception:
         # Fallback to manual cleanup
         try:
-            subprocess.run(
-                ["bash", "-c", f"lsof -ti:{port} | xargs kill -9 2>/dev/null || true"],
-                capture_output=True,
-                timeout=5,
-            )
-            time.sleep(1)
+            _kill_port_listeners(port)
         except:
             pass
         return False
 
 
+_NPM_INSTALL = ["npm", "install"]
+
+
 def install_dependencies(app_dir: Path, template: str = "unknown") -> bool:
-    """Install npm dependencies for both client and server."""
+    """Install npm dependencies for both client and server.
+
+    A root-level install (monorepo style) is tried first; otherwise the
+    server and client installs run concurrently since they share nothing.
+    """
     print("  [0/7] Installing dependencies...")
 
     # Check if root-level package.json exists (monorepo style)
     root_pkg = app_dir / "package.json"
     if root_pkg.exists():
-        root_success, _, _ = run_command(
-            ["npm", "install"],
+        root_success = run_command_rc(
+            _NPM_INSTALL,
             cwd=str(app_dir),
             timeout=180,
         )
@@ -393,30 +712,24 @@ def install_dependencies(app_dir: Path, template: str = "unknown") -> bool:
 
     # Try server/ or backend/ based on template
     server_dir = get_backend_dir(app_dir, template)
-    if server_dir.exists() and (server_dir / "package.json").exists():
-        server_success, _, _ = run_command(
-            ["npm", "install"],
-            cwd=str(server_dir),
-            timeout=180,
-        )
-        if not server_success:
-            print(f"    ⚠️  {server_dir.name} npm install failed")
-            return False
-    else:
+    if not (server_dir / "package.json").exists():
         print(f"    ⚠️  No {server_dir.name} directory or package.json")
         return False
 
     # Try client/ or frontend/ based on template
+    install_dirs = [server_dir]
     client_dir = get_frontend_dir(app_dir, template)
-    if client_dir.exists() and (client_dir / "package.json").exists():
-        client_success, _, _ = run_command(
-            ["npm", "install"],
-            cwd=str(client_dir),
-            timeout=180,
-        )
-        if not client_success:
-            print(f"    ⚠️  {client_dir.name} npm install failed")
-            return False
+    if (client_dir / "package.json").exists():
+        install_dirs.append(client_dir)
+
+    with ThreadPoolExecutor(max_workers=len(install_dirs)) as pool:
+        results = list(pool.map(lambda d: run_command_rc(_NPM_INSTALL, cwd=str(d), timeout=180), install_dirs))
+
+    for install_dir, ok in zip(install_dirs, results):
+        if not ok:
+            print(f"    ⚠️  {install_dir.name} npm install failed")
+    if not all(results):
+        return False
 
     print("    ✅ Dependencies installed")
     return True
@@ -430,13 +743,8 @@ def check_type_safety(app_dir: Path, template: str = "unknown") -> bool:
     print("  [3/7] Checking type safety...")
 
     # Determine which template script to use (prefer template-specific over docker)
-    if template == "dbx-sdk":
-        script_dir = "dbx-sdk"
-    elif template == "trpc":
-        script_dir = "trpc"
-    elif (app_dir / "Dockerfile").exists():
-        script_dir = "docker"
-    else:
+    script_dir = _pick_script_dir(app_dir, template, prefer_docker=False)
+    if script_dir is None:
         # Unknown template - fail
         print(f"  ⚠️  Unknown template: {template}")
         return False
@@ -448,7 +756,7 @@ def check_type_safety(app_dir: Path, template: str = "unknown") -> bool:
         return False
 
     # Run typecheck script
-    success, _, _ = run_command(
+    success = run_command_rc(
         ["bash", str(typecheck_script)],
         cwd=str(app_dir),
         timeout=60,
@@ -457,6 +765,27 @@ def check_type_safety(app_dir: Path, template: str = "unknown") -> bool:
     return success
 
 
+def has_test_file(src_dir: Path) -> bool:
+    """Return True as soon as a *.test.ts file is found under src_dir.
+
+    Walks with os.scandir, pruning dependency and build directories, and
+    stops at the first match instead of listing every test file.
+    """
+    stack = [str(src_dir)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _PRUNED_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".test.ts"):
+                        return True
+        except OSError:
+            continue
+    return False
+
+
 def check_tests_pass(app_dir: Path, template: str = "unknown") -> tuple[bool, float, bool]:
     """Metric 4: Tests pass with coverage.
 
@@ -465,13 +794,8 @@ def check_tests_pass(app_dir: Path, template: str = "unknown") -> tuple[bool, fl
     print("  [4/7] Checking tests pass...")
 
     # Determine which template script to use (prefer template-specific over docker)
-    if template == "dbx-sdk":
-        script_dir = "dbx-sdk"
-    elif template == "trpc":
-        script_dir = "trpc"
-    elif (app_dir / "Dockerfile").exists():
-        script_dir = "docker"
-    else:
+    script_dir = _pick_script_dir(app_dir, template, prefer_docker=False)
+    if script_dir is None:
         # Unknown template - fail
         return False, 0.0, False
 
@@ -486,67 +810,235 @@ def check_tests_pass(app_dir: Path, template: str = "unknown") -> tuple[bool, fl
     backend_dir = app_dir / "backend"
     has_tests = False
 
-    if server_dir.exists() and (server_dir / "src").exists():
-        test_files = list((server_dir / "src").glob("*.test.ts")) + list((server_dir / "src").glob("**/*.test.ts"))
-        has_tests = len(test_files) > 0
-    elif backend_dir.exists() and (backend_dir / "src").exists():
-        test_files = list((backend_dir / "src").glob("*.test.ts")) + list((backend_dir / "src").glob("**/*.test.ts"))
-        has_tests = len(test_files) > 0
+    if (server_dir / "src").is_dir():
+        has_tests = has_test_file(server_dir / "src")
+    elif (backend_dir / "src").is_dir():
+        has_tests = has_test_file(backend_dir / "src")
 
     # Run test script
-    success, stdout, stderr = run_command(
+    success, output = run_command_streamed(
         ["bash", str(test_script)],
         cwd=str(app_dir),
         timeout=120,
     )
 
-    # Parse coverage from Node.js test runner output
-    coverage_pct = 0.0
-    output = stdout + stderr
-    for line in output.split("\n"):
-        if "all files" in line.lower() and "%" in line:
-            parts = line.split("|")
-            if len(parts) >= 2:
-                try:
-                    coverage_pct = float(parts[1].strip().replace("%", ""))
-                except (ValueError, IndexError):
-                    pass
+    # Parse coverage from Node.js test runner output (summary is at the tail)
+    coverage_pct = parse_coverage_pct(output)
 
     return success, coverage_pct, has_tests
 
 
-def check_databricks_connectivity(app_dir: Path, template: str = "trpc", port: int = 8000) -> bool:
+async def check_databricks_connectivity_async(
+    app_dir: Path, template: str = "trpc", port: int = 8000, base_url: str | None = None
+) -> bool:
     """Metric 5: Can connect to Databricks and execute queries."""
     print("  [5/7] Checking Databricks connectivity...")
-    return _check_db_connectivity(app_dir, port, run_command, template)
+    return await _check_db_connectivity(app_dir, port, run_command, template, base_url)
 
 
-def check_data_validity_llm(app_dir: Path, prompt: str | None, template: str = "trpc") -> tuple[bool, str]:
-    """Metric 6: Binary check - does app return valid data from Databricks."""
-    print("  [6/7] Checking data validity (LLM)...")
+def check_databricks_connectivity(app_dir: Path, template: str = "trpc", port: int = 8000) -> bool:
+    """Metric 5: Synchronous wrapper for check_databricks_connectivity_async."""
+    return asyncio.run(check_databricks_connectivity_async(app_dir, template, port))
+
+
+def _llm_cache_key(model: str, user_text: str, image_bytes: bytes = b"") -> str:
+    """Content-addressed cache key for an LLM call."""
+    return hashlib.blake2b(model.encode() + user_text.encode() + image_bytes, digest_size=16).hexdigest()
+
+
+def _read_llm_cache(cache_key: str) -> str | None:
+    """Return a cached response text, or None on a cache miss."""
+    cache_file = LLM_CACHE_DIR / f"{cache_key}.json"
+    if not cache_file.exists():
+        return None
+    try:
+        return json.loads(cache_file.read_text())["response_text"]
+    except (json.JSONDecodeError, KeyError):
+        return None
+
+
+def _write_llm_cache(cache_key: str, model: str, response_text: str) -> None:
+    """Persist a non-empty response text for later runs."""
+    if not response_text:
+        return
+    try:
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (LLM_CACHE_DIR / f"{cache_key}.json").write_text(json.dumps({"model": model, "response_text": response_text}))
+    except OSError:
+        pass
+
+
+def _response_text(message: Any) -> str:
+    """Upper-cased text of the first content block ("" on bad format)."""
+    content_block = message.content[0]
+    return getattr(content_block, 'text', '').strip().upper()
+
+
+def _http_client_options() -> dict[str, Any]:
+    """Connection pool settings shared by the sync and async Anthropic clients.
+
+    Keeps enough idle connections alive for every concurrent LLM/VLM call to
+    skip the TLS handshake, and multiplexes over HTTP/2 when h2 is installed.
+    """
+    import importlib.util
+
+    import httpx
+
+    return {
+        "limits": httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        "http2": importlib.util.find_spec("h2") is not None,
+    }
+
+
+@functools.cache
+def _anthropic_client() -> "anthropic.Anthropic":
+    """Process-wide Anthropic client, so every call reuses one HTTP connection pool."""
+    return anthropic.Anthropic(
+        api_key=os.environ.get("ANTHROPIC_API_KEY"),
+        http_client=anthropic.DefaultHttpxClient(**_http_client_options()),
+    )
+
+
+@functools.cache
+def _async_anthropic_client() -> "anthropic.AsyncAnthropic":
+    """Process-wide async Anthropic client for the asyncio (Dagger) evaluation path."""
+    return anthropic.AsyncAnthropic(
+        api_key=os.environ.get("ANTHROPIC_API_KEY"),
+        http_client=anthropic.DefaultAsyncHttpxClient(**_http_client_options()),
+    )
+
+
+def _create_message_cached(model: str, max_tokens: int, content: Any, cache_key: str) -> str:
+    """Call the Anthropic Messages API, reusing a cached response text if present.
+
+    Returns the upper-cased text of the first content block ("" on bad format).
+    """
+    cached = _read_llm_cache(cache_key)
+    if cached is not None:
+        print("    ↺ Using cached LLM response")
+        return cached
+
+    message = _anthropic_client().messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": content}],
+    )
+
+    response_text = _response_text(message)
+    _write_llm_cache(cache_key, model, response_text)
+    return response_text
+
 
+async def _create_message_cached_async(model: str, max_tokens: int, content: Any, cache_key: str) -> str:
+    """Async variant of _create_message_cached using the shared AsyncAnthropic client."""
+    cached = _read_llm_cache(cache_key)
+    if cached is not None:
+        print("    ↺ Using cached LLM response")
+        return cached
+
+    message = await _async_anthropic_client().messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": content}],
+    )
+
+    response_text = _response_text(message)
+    _write_llm_cache(cache_key, model, response_text)
+    return response_text
+
+
+# Longest wait for a Message Batches job before falling back to individual calls
+LLM_BATCH_TIMEOUT_SEC = 30 * 60
+
+
+def run_llm_batch(
+    requests: dict[str, dict], poll_interval: float = 5.0, timeout: float = LLM_BATCH_TIMEOUT_SEC
+) -> dict[str, str]:
+    """Run many LLM requests as a single Message Batches job.
+
+    Args:
+        requests: custom_id -> request dict (model, max_tokens, content, cache_key)
+        poll_interval: Seconds between batch status polls
+        timeout: Seconds to wait for the batch before cancelling it
+
+    Returns:
+        custom_id -> upper-cased response text ("" if the request failed)
+
+    Raises:
+        TimeoutError: The batch did not end within timeout (it is cancelled)
+    """
+    texts: dict[str, str] = {}
+    to_submit: dict[str, dict] = {}
+    for custom_id, request in requests.items():
+        cached = _read_llm_cache(request["cache_key"])
+        if cached is not None:
+            texts[custom_id] = cached
+        else:
+            to_submit[custom_id] = request
+
+    if not to_submit:
+        return texts
+
+    client = _anthropic_client()
+    batch = client.messages.batches.create(
+        requests=[
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": request["model"],
+                    "max_tokens": request["max_tokens"],
+                    "messages": [{"role": "user", "content": request["content"]}],
+                },
+            }
+            for custom_id, request in to_submit.items()
+        ]
+    )
+    print(f"  Submitted LLM batch {batch.id} ({len(to_submit)} requests, {len(texts)} cached)")
+
+    # Batches may take up to 24h; don't let one hold up the whole run
+    deadline = time.monotonic() + timeout
+    while batch.processing_status != "ended":
+        if time.monotonic() >= deadline:
+            try:
+                client.messages.batches.cancel(batch.id)
+            except Exception:
+                pass
+            raise TimeoutError(f"batch {batch.id} still running after {timeout:.0f}s, cancelled")
+        time.sleep(poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type != "succeeded":
+            texts[entry.custom_id] = ""
+            continue
+        response_text = _response_text(entry.result.message)
+        texts[entry.custom_id] = response_text
+        request = to_submit[entry.custom_id]
+        _write_llm_cache(request["cache_key"], request["model"], response_text)
+
+    return texts
+
+
+def _data_validity_request(app_dir: Path, prompt: str | None, template: str) -> tuple[dict | None, str]:
+    """Build the LLM request for the data validity check.
+
+    Returns:
+        (request, skip_reason) - request is None when the check can't run
+    """
     if not anthropic or not prompt:
-        return False, "Skipped: Anthropic client not available or no prompt"
+        return None, "Skipped: Anthropic client not available or no prompt"
 
     # Extract SQL queries using template-aware extraction
     queries = extract_sql_queries(app_dir, template)
 
     if not queries:
-        return False, "No SQL query found"
+        return None, "No SQL query found"
 
     # Use first query for validation
     sql_query = queries[0]
 
-    # Call LLM for validation - simplified to binary check
-    try:
-        client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-        message = client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=200,
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"""Analyze this SQL query for a Databricks app.
+    model = "claude-haiku-4-5-20251001"
+    user_text = f"""Analyze this SQL query for a Databricks app.
 
 Prompt: {prompt}
 
@@ -559,32 +1051,89 @@ Consider:
 - Are the column names meaningful?
 - Are there obvious syntax or logic errors?
 
-Respond with ONLY: YES or NO""",
-                }
-            ],
-        )
+Respond with ONLY: YES or NO"""
+    return {
+        "model": model,
+        "max_tokens": 200,
+        "content": user_text,
+        "cache_key": _llm_cache_key(model, user_text),
+    }, ""
 
-        # Extract text from first content block
-        content_block = message.content[0]
-        response_text = getattr(content_block, 'text', '').strip().upper()
-        if response_text:
-            return "YES" in response_text, response_text
-        else:
-            return False, "Invalid response format"
 
+def _data_validity_verdict(response_text: str) -> tuple[bool, str]:
+    """Interpret the data validity LLM response."""
+    if response_text:
+        return "YES" in response_text, response_text
+    return False, "Invalid response format"
+
+
+def check_data_validity_llm(app_dir: Path, prompt: str | None, template: str = "trpc") -> tuple[bool, str]:
+    """Metric 6: Binary check - does app return valid data from Databricks."""
+    print("  [6/7] Checking data validity (LLM)...")
+
+    request, skip_reason = _data_validity_request(app_dir, prompt, template)
+    if request is None:
+        return False, skip_reason
+
+    # Call LLM for validation - simplified to binary check
+    try:
+        return _data_validity_verdict(_create_message_cached(**request))
     except Exception as e:
         return False, f"LLM check failed: {str(e)}"
 
 
-def check_ui_functional_vlm(app_dir: Path, _prompt: str | None) -> tuple[bool, str]:
-    """Metric 7: VLM binary check - does UI render without errors?
+async def check_data_validity_llm_async(app_dir: Path, prompt: str | None, template: str = "trpc") -> tuple[bool, str]:
+    """Metric 6: Async variant of check_data_validity_llm."""
+    print("  [6/7] Checking data validity (LLM)...")
 
-    Returns: (passes: bool, details: str)
+    # Query extraction reads source files, so it stays off the event loop
+    request, skip_reason = await asyncio.to_thread(_data_validity_request, app_dir, prompt, template)
+    if request is None:
+        return False, skip_reason
+
+    try:
+        return _data_validity_verdict(await _create_message_cached_async(**request))
+    except Exception as e:
+        return False, f"LLM check failed: {str(e)}"
+
+
+def _encode_screenshot(image_bytes: bytes, max_side: int = 1280) -> tuple[str, str]:
+    """Base64-encode a screenshot for the VLM, returning (data, media_type).
+
+    When Pillow is available the image is downscaled (the VLM ignores extra
+    resolution) and re-encoded as WEBP, which shrinks the upload payload.
     """
-    print("  [7/7] Checking UI renders (VLM)...")
+    if Image is not None:
+        try:
+            img = Image.open(io.BytesIO(image_bytes))
+            img.thumbnail((max_side, max_side))
+            buf = io.BytesIO()
+            img.save(buf, format="WEBP", quality=80)
+            return base64.b64encode(buf.getvalue()).decode("ascii"), "image/webp"
+        except Exception:
+            pass
+    return base64.b64encode(image_bytes).decode("ascii"), "image/png"
+
+
+@functools.lru_cache(maxsize=64)
+def _load_screenshot(path: str, mtime_ns: int) -> tuple[bytes, str, str]:
+    """Read and encode a screenshot once, returning (raw_bytes, data, media_type).
 
+    Keyed on mtime so a retaken screenshot is re-encoded; repeated VLM
+    requests for the same app reuse the downscaled base64 payload.
+    """
+    image_bytes = Path(path).read_bytes()
+    return (image_bytes, *_encode_screenshot(image_bytes))
+
+
+def _ui_request(app_dir: Path) -> tuple[dict | None, str]:
+    """Build the VLM request for the UI check.
+
+    Returns:
+        (request, skip_reason) - request is None when the check can't run
+    """
     if not anthropic:
-        return False, "Skipped: Anthropic client not available"
+        return None, "Skipped: Anthropic client not available"
 
     # Find screenshot
     screenshot_dir = app_dir / "screenshot_output"
@@ -595,34 +1144,13 @@ def check_ui_functional_vlm(app_dir: Path, _prompt: str | None) -> tuple[bool, s
         screenshot_path = app_dir / "screenshot.png"
 
     if not screenshot_path.exists():
-        return False, "No screenshot found"
+        return None, "No screenshot found"
 
-    # Read screenshot as base64
-    import base64
+    # Read screenshot and encode (downscaled when Pillow is available)
+    image_bytes, image_data, media_type = _load_screenshot(str(screenshot_path), screenshot_path.stat().st_mtime_ns)
 
-    image_data = base64.standard_b64encode(screenshot_path.read_bytes()).decode("utf-8")
-
-    # Call VLM for validation
-    try:
-        client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-        message = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=500,
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": "image/png",
-                                "data": image_data,
-                            },
-                        },
-                        {
-                            "type": "text",
-                            "text": """Look at this screenshot and answer ONLY these objective binary questions:
+    model = "claude-sonnet-4-5-20250929"
+    user_text = """Look at this screenshot and answer ONLY these objective binary questions:
 
 1. Is the page NOT blank (does something render)? Answer: YES or NO
 2. Are there NO visible error messages (no 404, 500, crash messages, red error text)? Answer: YES or NO
@@ -634,29 +1162,91 @@ ONLY verify: Does the page render without errors?
 If ALL THREE answers are YES, respond: PASS
 If ANY answer is NO, respond: FAIL
 
-Respond with ONLY one word: PASS or FAIL""",
-                        },
-                    ],
-                }
-            ],
-        )
+Respond with ONLY one word: PASS or FAIL"""
+    return {
+        "model": model,
+        "max_tokens": 500,
+        "content": [
+            {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": media_type,
+                    "data": image_data,
+                },
+            },
+            {"type": "text", "text": user_text},
+        ],
+        "cache_key": _llm_cache_key(model, user_text, image_bytes),
+    }, ""
+
+
+def _ui_verdict(response_text: str) -> tuple[bool, str]:
+    """Interpret the UI VLM response: PASS or FAIL."""
+    if not response_text:
+        return False, "Invalid response format"
+    if "PASS" in response_text:
+        return True, "UI renders without errors"
+    return False, f"VLM check failed: {response_text}"
 
-        # Extract text from first content block
-        content_block = message.content[0]
-        response_text = getattr(content_block, 'text', '').strip().upper()
-        if not response_text:
-            return False, "Invalid response format"
 
-        # Binary check: PASS or FAIL
-        if "PASS" in response_text:
-            return True, "UI renders without errors"
-        else:
-            return False, f"VLM check failed: {response_text}"
+def check_ui_functional_vlm(app_dir: Path, _prompt: str | None) -> tuple[bool, str]:
+    """Metric 7: VLM binary check - does UI render without errors?
+
+    Returns: (passes: bool, details: str)
+    """
+    print("  [7/7] Checking UI renders (VLM)...")
 
+    request, skip_reason = _ui_request(app_dir)
+    if request is None:
+        return False, skip_reason
+
+    # Call VLM for validation
+    try:
+        return _ui_verdict(_create_message_cached(**request))
     except Exception as e:
         return False, f"VLM check failed: {str(e)}"
 
 
+async def check_ui_functional_vlm_async(app_dir: Path, _prompt: str | None) -> tuple[bool, str]:
+    """Metric 7: Async variant of check_ui_functional_vlm."""
+    print("  [7/7] Checking UI renders (VLM)...")
+
+    # Screenshot read + re-encode is blocking work, so it stays off the event loop
+    request, skip_reason = await asyncio.to_thread(_ui_request, app_dir)
+    if request is None:
+        return False, skip_reason
+
+    try:
+        return _ui_verdict(await _create_message_cached_async(**request))
+    except Exception as e:
+        return False, f"VLM check failed: {str(e)}"
+
+
+def _list_dir(path: Path) -> set[str]:
+    """Return entry names in a directory (empty set if it doesn't exist)."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+def list_app_dirs(apps_dir: Path) -> list[Path]:
+    """Return the non-hidden app directories under apps_dir, sorted by name.
+
+    Uses os.scandir so the directory check is answered from the readdir
+    entry type rather than a stat() per entry.
+    """
+    with os.scandir(apps_dir) as it:
+        names = sorted(entry.name for entry in it if not entry.name.startswith(".") and entry.is_dir())
+    return [apps_dir / name for name in names]
+
+
+# Any of these in the README counts as setup instructions
+_README_SETUP_RE = re.compile(r"setup|installation|getting started|quick start", re.IGNORECASE)
+
+
 def check_local_runability(app_dir: Path, template: str = "unknown") -> tuple[int, list[str]]:
     """Metric 8: Local runability - how easy is it to run locally?"""
     print("  [8/9] Checking local runability...")
@@ -664,11 +1254,13 @@ def check_local_runability(app_dir: Path, template: str = "unknown") -> tuple[in
     score = 0
     details = []
 
+    # One directory read instead of a stat per probed file
+    top = _list_dir(app_dir)
+
     # Check 1: README exists with setup instructions
     readme = app_dir / "README.md"
-    if readme.exists():
-        content = readme.read_text().lower()
-        if any(word in content for word in ["setup", "installation", "getting started", "quick start"]):
+    if "README.md" in top:
+        if _README_SETUP_RE.search(readme.read_text()):
             score += 1
             details.append("✓ README with setup instructions")
         else:
@@ -677,7 +1269,7 @@ def check_local_runability(app_dir: Path, template: str = "unknown") -> tuple[in
         details.append("✗ No README.md")
 
     # Check 2: .env.example or .env.template exists
-    if (app_dir / ".env.example").exists() or (app_dir / ".env.template").exists():
+    if ".env.example" in top or ".env.template" in top:
         score += 1
         details.append("✓ Environment template exists")
     else:
@@ -685,8 +1277,10 @@ def check_local_runability(app_dir: Path, template: str = "unknown") -> tuple[in
 
     # Check 3: Dependencies install cleanly based on template
     server_dir = get_backend_dir(app_dir, template)
-    if server_dir.exists():
-        server_install, _, _ = run_command(
+    server_exists = server_dir.name in top
+    server_entries = _list_dir(server_dir) if server_exists else set()
+    if server_exists:
+        server_install = run_command_rc(
             ["npm", "install", "--dry-run"],
             cwd=str(server_dir),
             timeout=60,
@@ -702,11 +1296,11 @@ def check_local_runability(app_dir: Path, template: str = "unknown") -> tuple[in
     # Check 4: npm start command defined
     # For DBX SDK (root package.json) check root, for tRPC check server_dir
     if template == "dbx-sdk":
-        pkg_path = app_dir / "package.json"
+        pkg_path = app_dir / "package.json" if "package.json" in top else None
     else:
-        pkg_path = server_dir / "package.json" if server_dir.exists() else None
+        pkg_path = server_dir / "package.json" if "package.json" in server_entries else None
 
-    if pkg_path and pkg_path.exists():
+    if pkg_path:
         try:
             pkg_data = json.loads(pkg_path.read_text())
             if "start" in pkg_data.get("scripts", {}):
@@ -723,12 +1317,12 @@ def check_local_runability(app_dir: Path, template: str = "unknown") -> tuple[in
     # We won't actually start it here as it's redundant with runtime check
     # Instead, check if entry point exists
     entry_point = None
-    if server_dir.exists():
+    if "src" in server_entries and "index.ts" in _list_dir(server_dir / "src"):
         entry_point = server_dir / "src" / "index.ts"
-        if not entry_point.exists():
-            entry_point = server_dir / "index.ts"
+    elif "index.ts" in server_entries:
+        entry_point = server_dir / "index.ts"
 
-    if entry_point and entry_point.exists():
+    if entry_point:
         score += 1
         details.append(f"✓ Entry point exists ({entry_point.relative_to(app_dir)})")
     else:
@@ -737,6 +1331,40 @@ def check_local_runability(app_dir: Path, template: str = "unknown") -> tuple[in
     return score, details
 
 
+@functools.lru_cache(maxsize=256)
+def _analyze_dockerfile(path: str, mtime_ns: int) -> tuple[bool, bool, bool]:
+    """Return (is_multistage, is_alpine, has_healthcheck) for a Dockerfile.
+
+    Keyed on mtime so an edited Dockerfile is re-read.
+    """
+    content = Path(path).read_text()
+    return content.count("FROM") > 1, "alpine" in content.lower(), "HEALTHCHECK" in content
+
+
+_SECRET_RE = re.compile(rb"DATABRICKS_TOKEN=dapi|password=|api_key=|secret=", re.IGNORECASE)
+
+
+def has_hardcoded_secrets(app_dir: Path) -> bool:
+    """Scan app files for hardcoded credentials in a single in-process pass.
+
+    Prunes dependency, VCS and build directories, skips binary files (a NUL
+    byte in the first 4 KiB) and stops at the first match.
+    """
+    for root, dirnames, filenames in os.walk(app_dir):
+        dirnames[:] = [d for d in dirnames if d not in _PRUNED_DIRS]
+        for name in filenames:
+            try:
+                with open(os.path.join(root, name), "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue
+            if b"\0" in data[:4096]:
+                continue
+            if _SECRET_RE.search(data):
+                return True
+    return False
+
+
 def check_deployability(app_dir: Path) -> tuple[int, list[str]]:
     """Metric 9: Deployability - how production-ready is this?"""
     print("  [9/9] Checking deployability...")
@@ -744,9 +1372,11 @@ def check_deployability(app_dir: Path) -> tuple[int, list[str]]:
     score = 0
     details = []
 
+    top = _list_dir(app_dir)
+
     # Check 1: Dockerfile exists (already checked in build_success, but recheck)
     dockerfile = app_dir / "Dockerfile"
-    if dockerfile.exists():
+    if "Dockerfile" in top:
         score += 1
         details.append("✓ Dockerfile exists")
     else:
@@ -754,9 +1384,7 @@ def check_deployability(app_dir: Path) -> tuple[int, list[str]]:
         return score, details  # Can't check other items without Dockerfile
 
     # Check 2: Multi-stage build or optimized image
-    dockerfile_content = dockerfile.read_text()
-    is_multistage = "FROM" in dockerfile_content and dockerfile_content.count("FROM") > 1
-    is_alpine = "alpine" in dockerfile_content.lower()
+    is_multistage, is_alpine, has_healthcheck = _analyze_dockerfile(str(dockerfile), dockerfile.stat().st_mtime_ns)
 
     if is_multistage:
         score += 1
@@ -768,41 +1396,29 @@ def check_deployability(app_dir: Path) -> tuple[int, list[str]]:
         details.append("✗ No multi-stage build or alpine optimization")
 
     # Check 3: Health check defined in Dockerfile
-    if "HEALTHCHECK" in dockerfile_content:
+    if has_healthcheck:
         score += 1
         details.append("✓ HEALTHCHECK defined in Dockerfile")
     else:
         details.append("✗ No HEALTHCHECK in Dockerfile")
 
     # Check 4: No hardcoded secrets
-    has_secrets = False
-    for pattern in ["DATABRICKS_TOKEN=dapi", "password=", "api_key=", "secret="]:
-        success, _, _ = run_command(
-            ["grep", "-r", "-i", pattern, ".", "--exclude-dir=node_modules", "--exclude-dir=.git"],
-            cwd=str(app_dir),
-            timeout=10,
-        )
-        if success:  # grep returns 0 if pattern found
-            has_secrets = True
-            break
-
-    if not has_secrets:
+    if not has_hardcoded_secrets(app_dir):
         score += 1
         details.append("✓ No hardcoded secrets detected")
     else:
         details.append("✗ Potential hardcoded secrets found")
 
     # Check 5: Deployment config exists
-    deploy_files = ["docker-compose.yml", "kubernetes.yaml", "k8s.yaml", "fly.toml", "render.yaml"]
-    has_deploy_config = any((app_dir / f).exists() for f in deploy_files)
+    deploy_files = {"docker-compose.yml", "kubernetes.yaml", "k8s.yaml", "fly.toml", "render.yaml"}
+    has_deploy_config = bool(top & deploy_files)
 
     if has_deploy_config:
         score += 1
         details.append("✓ Deployment config found")
     else:
         # Build script is acceptable alternative
-        build_script = app_dir / "build.sh"
-        if build_script.exists():
+        if "build.sh" in top:
             score += 1
             details.append("✓ Build script exists")
         else:
@@ -811,13 +1427,144 @@ def check_deployability(app_dir: Path) -> tuple[int, list[str]]:
     return score, details
 
 
-def evaluate_app(app_dir: Path, prompt: str | None = None, port: int = 8000) -> EvalResult:
+# Backend source roots whose *.test.ts files count towards has_tests
+_TEST_ROOTS = ("server/src/", "backend/src/")
+
+
+def scan_ts_sources(app_dir: Path) -> tuple[int, bool]:
+    """Count TypeScript source files and detect backend tests in a single pass.
+
+    Uses ``git ls-files`` when the app is its own git repo (node_modules is
+    gitignored so it is never walked), otherwise an os.walk that prunes
+    node_modules, .git and build directories before descending.
+
+    Returns:
+        Tuple of (ts_file_count, has_tests)
+    """
+    if (app_dir / ".git").exists():
+        success, stdout, _ = run_command(
+            ["git", "ls-files", "--cached", "--others", "--exclude-standard", "--", "*.ts"],
+            cwd=str(app_dir),
+            timeout=30,
+        )
+        if success:
+            paths = stdout.splitlines()
+            has_tests = any(p.endswith(".test.ts") and p.startswith(_TEST_ROOTS) for p in paths)
+            return len(paths), has_tests
+
+    count = 0
+    has_tests = False
+    for root, dirnames, filenames in os.walk(app_dir):
+        dirnames[:] = [d for d in dirnames if d not in _PRUNED_DIRS]
+        ts_files = [f for f in filenames if f.endswith(".ts")]
+        count += len(ts_files)
+        if not has_tests and ts_files:
+            rel = Path(root).relative_to(app_dir).as_posix() + "/"
+            has_tests = rel.startswith(_TEST_ROOTS) and any(f.endswith(".test.ts") for f in ts_files)
+    return count, has_tests
+
+
+def count_ts_files(app_dir: Path) -> int:
+    """Count TypeScript source files in an app, ignoring node_modules and build output."""
+    return scan_ts_sources(app_dir)[0]
+
+
+@functools.cache
+def evaluator_version() -> str:
+    """Hash the content of the evaluator sources and the eval/ scripts.
+
+    Used as a salt so results are not reused after the checks themselves change.
+    """
+    cli_dir = Path(__file__).resolve().parent
+    paths = [cli_dir / name for name in _EVALUATOR_SOURCES]
+    paths += sorted(p for p in (cli_dir / "eval").rglob("*") if p.is_file())
+    h = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            continue
+        h.update(f"{path.relative_to(cli_dir).as_posix()}\0{len(data)}\n".encode())
+        h.update(data)
+    return h.hexdigest()
+
+
+def app_fingerprint(app_dir: Path) -> str:
+    """Hash an app's inputs (relative path, size and mtime of every file).
+
+    File contents are not read: a file is treated as unchanged while its size
+    and mtime are, which keeps the walk cheap on large trees. The hash is
+    salted with evaluator_version(), so any change to the evaluator also
+    changes every fingerprint.
+
+    Dependency, VCS and build directories are pruned like in scan_ts_sources,
+    and the eval_result.json written by single-app runs is ignored.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(evaluator_version().encode())
+    for root, dirnames, filenames in os.walk(app_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in _PRUNED_DIRS)
+        rel_root = Path(root).relative_to(app_dir).as_posix()
+        for name in sorted(filenames):
+            if name == "eval_result.json" and rel_root == ".":
+                continue
+            st = os.lstat(os.path.join(root, name))
+            h.update(f"{rel_root}/{name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def build_context_excludes_installs(app_dir: Path, template: str) -> bool:
+    """True if the app builds with Docker and .dockerignore excludes every
+    node_modules that install_dependencies may write.
+
+    Only then can the Docker build run while npm install is still writing
+    files without the build context changing underneath it.
+    """
+    try:
+        lines = (app_dir / ".dockerignore").read_text().splitlines()
+    except OSError:
+        return False
+    if not (app_dir / "Dockerfile").exists():
+        return False
+
+    patterns = [line.strip().rstrip("/") for line in lines if line.strip() and not line.startswith("#")]
+    install_dirs = [app_dir, get_backend_dir(app_dir, template), get_frontend_dir(app_dir, template)]
+    for install_dir in install_dirs:
+        if not (install_dir / "package.json").exists():
+            continue
+        rel = (install_dir / "node_modules").relative_to(app_dir).as_posix()
+        if not any(fnmatch.fnmatch(rel, p) or fnmatch.fnmatch(rel, p.removeprefix("**/")) for p in patterns):
+            return False
+    return True
+
+
+# Checks that must pass before a dependent check can produce a meaningful result
+METRIC_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    "type_safety": ("deps",),
+    "tests": ("deps",),
+    "databricks_connectivity": ("runtime",),
+    "data_validity": ("databricks_connectivity",),
+    "ui_functional": ("runtime",),
+}
+
+
+def failed_prerequisites(metric: str, passed: dict[str, bool]) -> list[str]:
+    """Return the prerequisites of metric that did not pass (empty if it can run)."""
+    return [dep for dep in METRIC_DEPENDENCIES.get(metric, ()) if not passed.get(dep)]
+
+
+def evaluate_app(
+    app_dir: Path, prompt: str | None = None, port: int | None = 8000, defer_llm: bool = False
+) -> EvalResult:
     """Run full evaluation on an app.
 
     Args:
         app_dir: Path to the app directory
         prompt: Optional prompt used to generate the app
-        port: Port to use for Docker containers (default: 8000)
+        port: Port to use for Docker containers (default: 8000); None picks a
+            free host port right before the app starts (used by --all workers)
+        defer_llm: Don't call the LLM/VLM checks; store their requests in
+            details["pending_llm"] for apply_llm_verdicts() after a batch run
     """
     print(f"\nEvaluating: {app_dir.name}")
     print("=" * 60)
@@ -830,16 +1577,24 @@ def evaluate_app(app_dir: Path, prompt: str | None = None, port: int = 8000) ->
     metrics.template_type = template
     issues = []
     details = {}
-    container_name = f"eval-{app_dir.name}-{int(time.time())}"
+    container_name = f"eval-{app_dir.name}-{uuid.uuid4().hex}"
 
     runtime_success = False  # Initialize to avoid UnboundLocalError
 
     try:
-        # Install dependencies first (needed for TypeScript and tests)
-        deps_installed = install_dependencies(app_dir, template)
+        # Install dependencies first (needed for TypeScript and tests). A Docker
+        # build installs its own, so it overlaps the host install whenever the
+        # node_modules being written are outside its build context.
+        if build_context_excludes_installs(app_dir, template):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                build_future = pool.submit(check_build_success, app_dir, template)
+                deps_installed = install_dependencies(app_dir, template)
+                build_success, build_meta = build_future.result()
+        else:
+            deps_installed = install_dependencies(app_dir, template)
+            build_success, build_meta = check_build_success(app_dir, template)
 
         # Metric 1: Build
-        build_success, build_meta = check_build_success(app_dir, template)
         metrics.build_success = build_success
         metrics.build_time_sec = build_meta.get("build_time_sec", 0.0)
         metrics.has_dockerfile = build_meta.get("has_dockerfile", False)
@@ -850,6 +1605,9 @@ def evaluate_app(app_dir: Path, prompt: str | None = None, port: int = 8000) ->
                 issues.append("Build failed (npm install)")
 
         # Metric 2: Runtime (always try, not just if build succeeded)
+        if port is None:
+            # Picked only now, so the port is still free when the app binds it
+            port = find_free_port()
         runtime_success, runtime_meta = check_runtime_success(app_dir, container_name, template, port)
         metrics.runtime_success = runtime_success
         metrics.startup_time_sec = runtime_meta.get("startup_time_sec", 0.0)
@@ -859,9 +1617,77 @@ def evaluate_app(app_dir: Path, prompt: str | None = None, port: int = 8000) ->
             else:
                 issues.append("App failed to start or respond")
 
+        # Checks whose prerequisites failed are skipped (left False) instead of
+        # spending subprocess time and LLM/VLM calls on a doomed result
+        passed = {"deps": deps_installed, "runtime": runtime_success}
+
+        # Metrics 3, 4, 8 and 9 only need the app directory, so they run in worker
+        # threads (their subprocesses release the GIL) while this thread does the
+        # checks 5-7 that talk to the running app
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            run_types = not failed_prerequisites("type_safety", passed)
+            run_tests = not failed_prerequisites("tests", passed)
+            type_future = pool.submit(check_type_safety, app_dir, template) if run_types else None
+            tests_future = pool.submit(check_tests_pass, app_dir, template) if run_tests else None
+            local_future = pool.submit(check_local_runability, app_dir, template)
+            deploy_future = pool.submit(check_deployability, app_dir)
+
+            runtime_issues = []
+            # Metric 5: Databricks connectivity (only if runtime succeeded)
+            if not failed_prerequisites("databricks_connectivity", passed):
+                db_success = check_databricks_connectivity(app_dir, template, port)
+                metrics.databricks_connectivity = db_success
+                passed["databricks_connectivity"] = db_success
+                if not db_success:
+                    runtime_issues.append("Databricks connectivity failed")
+            run_data = not failed_prerequisites("data_validity", passed)
+            run_ui = not failed_prerequisites("ui_functional", passed)
+
+            if defer_llm:
+                # Metrics 6-7 are resolved later in one batch across all apps
+                pending_llm = {}
+                if run_data:
+                    request, skip_reason = _data_validity_request(app_dir, prompt, template)
+                    if request is not None:
+                        pending_llm["data"] = request
+                    else:
+                        runtime_issues.append(f"Data validity concerns: {skip_reason}")
+                if run_ui:
+                    request, skip_reason = _ui_request(app_dir)
+                    if request is not None:
+                        pending_llm["ui"] = request
+                    else:
+                        runtime_issues.append(f"UI concerns: {skip_reason}")
+                if pending_llm:
+                    details["pending_llm"] = pending_llm
+            else:
+                # The LLM and VLM calls are independent; the VLM one runs in the pool
+                ui_future = pool.submit(check_ui_functional_vlm, app_dir, prompt) if run_ui else None
+
+                # Metric 6: Data validity (LLM - binary check) - NOT INCLUDED IN SCORE
+                if run_data:
+                    data_returned, data_details = check_data_validity_llm(app_dir, prompt, template)
+                    metrics.data_returned = data_returned
+                    if not data_returned:
+                        runtime_issues.append(f"Data validity concerns: {data_details}")
+
+                # Metric 7: UI functional (VLM - binary check) - NOT INCLUDED IN SCORE
+                if ui_future is not None:
+                    ui_renders, ui_details = ui_future.result()
+                    metrics.ui_renders = ui_renders
+                    if not ui_renders:
+                        runtime_issues.append(f"UI concerns: {ui_details}")
+
+            if not runtime_success:
+                print("  [5-7/7] Skipping DB/data/UI checks (runtime failed)")
+                runtime_issues.append("DB/data/UI checks skipped: prerequisite failed (runtime)")
+            elif not run_data:
+                runtime_issues.append("Data validity skipped: prerequisite failed (Databricks connectivity)")
+
+        # Collect in metric order so issues are listed as in a sequential run
         # Metric 3: Type safety (requires dependencies)
-        if deps_installed:
-            type_safety = check_type_safety(app_dir, template)
+        if type_future is not None:
+            type_safety = type_future.result()
             metrics.type_safety = type_safety
             # Only flag TS errors as issues if they cause build/runtime problems
             # (Since apps use tsx which skips type checking, TS strictness is informational)
@@ -871,8 +1697,8 @@ def evaluate_app(app_dir: Path, prompt: str | None = None, port: int = 8000) ->
             issues.append("Dependencies installation failed")
 
         # Metric 4: Tests (requires dependencies)
-        if deps_installed:
-            tests_pass, coverage, has_tests = check_tests_pass(app_dir, template)
+        if tests_future is not None:
+            tests_pass, coverage, has_tests = tests_future.result()
             metrics.tests_pass = tests_pass
             metrics.test_coverage_pct = coverage
             metrics.has_tests = has_tests
@@ -881,35 +1707,18 @@ def evaluate_app(app_dir: Path, prompt: str | None = None, port: int = 8000) ->
             if coverage < 70:
                 issues.append(f"Test coverage below 70% ({coverage:.1f}%)")
 
-        # Metric 5: Databricks connectivity (only if runtime succeeded)
-        if runtime_success:
-            db_success = check_databricks_connectivity(app_dir, template, port)
-            metrics.databricks_connectivity = db_success
-            if not db_success:
-                issues.append("Databricks connectivity failed")
-
-            # Metric 6: Data validity (LLM - binary check) - NOT INCLUDED IN SCORE
-            if db_success:
-                data_returned, data_details = check_data_validity_llm(app_dir, prompt, template)
-                metrics.data_returned = data_returned
-                if not data_returned:
-                    issues.append(f"Data validity concerns: {data_details}")
-
-            # Metric 7: UI functional (VLM - binary check) - NOT INCLUDED IN SCORE
-            ui_renders, ui_details = check_ui_functional_vlm(app_dir, prompt)
-            metrics.ui_renders = ui_renders
-            if not ui_renders:
-                issues.append(f"UI concerns: {ui_details}")
+        # Metrics 5-7
+        issues.extend(runtime_issues)
 
         # Metric 8: Local runability (DevX)
-        local_score, local_details = check_local_runability(app_dir, template)
+        local_score, local_details = local_future.result()
         metrics.local_runability_score = local_score
         details["local_runability"] = local_details
         if local_score < 3:
             issues.append(f"Local runability concerns ({local_score}/5): {'; '.join([d for d in local_details if '✗' in d])}")
 
         # Metric 9: Deployability (DevX)
-        deploy_score, deploy_details = check_deployability(app_dir)
+        deploy_score, deploy_details = deploy_future.result()
         metrics.deployability_score = deploy_score
         details["deployability"] = deploy_details
         if deploy_score < 3:
@@ -931,7 +1740,7 @@ def evaluate_app(app_dir: Path, prompt: str | None = None, port: int = 8000) ->
         # Calculate efficiency metric from generation data if available
         generation_metrics_file = app_dir / "generation_metrics.json"
         if generation_metrics_file.exists():
-            generation_metrics = json.loads(generation_metrics_file.read_text())
+            generation_metrics = json_loads(generation_metrics_file.read_bytes())
             tokens = generation_metrics.get("input_tokens", 0) + generation_metrics.get("output_tokens", 0)
             turns = generation_metrics.get("turns")
             validations = generation_metrics.get("validation_runs")
@@ -943,15 +1752,12 @@ def evaluate_app(app_dir: Path, prompt: str | None = None, port: int = 8000) ->
             )
 
         # Add LOC count
-        metrics.total_loc = sum(
-            1
-            for f in app_dir.rglob("*.ts")
-            if f.is_file() and "node_modules" not in str(f)
-        )
+        metrics.total_loc = count_ts_files(app_dir)
 
     finally:
-        # Always cleanup any running apps/containers
-        _stop_app(app_dir, template)
+        # Always cleanup any running apps/containers (none if no port was picked yet)
+        if port is not None:
+            _stop_app(app_dir, template, port)
 
     print(f"\nIssues: {len(issues)}")
 
@@ -965,6 +1771,55 @@ def evaluate_app(app_dir: Path, prompt: str | None = None, port: int = 8000) ->
     )
 
 
+def apply_llm_verdicts(results: list[dict]) -> None:
+    """Resolve deferred LLM/VLM checks for all results with one batch job.
+
+    Updates each result dict in place: sets data_returned / ui_renders and
+    appends the same issues the inline checks would have reported.
+    """
+    requests = {}
+    for i, result in enumerate(results):
+        for kind, request in result["details"].get("pending_llm", {}).items():
+            requests[f"app{i}-{kind}"] = request
+
+    if not requests:
+        return
+
+    print(f"\nRunning {len(requests)} LLM/VLM checks as a batch...")
+    try:
+        texts = run_llm_batch(requests)
+        errors = {}
+    except Exception as e:
+        print(f"  ⚠️  Batch failed ({e}), falling back to individual calls")
+        texts, errors = {}, {}
+        for custom_id, request in requests.items():
+            try:
+                texts[custom_id] = _create_message_cached(**request)
+            except Exception as call_error:
+                errors[custom_id] = str(call_error)
+
+    for i, result in enumerate(results):
+        pending = result["details"].pop("pending_llm", {})
+        if "data" in pending:
+            custom_id = f"app{i}-data"
+            if custom_id in errors:
+                data_returned, data_details = False, f"LLM check failed: {errors[custom_id]}"
+            else:
+                data_returned, data_details = _data_validity_verdict(texts.get(custom_id, ""))
+            result["metrics"]["data_returned"] = data_returned
+            if not data_returned:
+                result["issues"].append(f"Data validity concerns: {data_details}")
+        if "ui" in pending:
+            custom_id = f"app{i}-ui"
+            if custom_id in errors:
+                ui_renders, ui_details = False, f"VLM check failed: {errors[custom_id]}"
+            else:
+                ui_renders, ui_details = _ui_verdict(texts.get(custom_id, ""))
+            result["metrics"]["ui_renders"] = ui_renders
+            if not ui_renders:
+                result["issues"].append(f"UI concerns: {ui_details}")
+
+
 def load_prompts_from_bulk_results(bulk_results_file: Path) -> tuple[dict[str, str], dict[str, Any]]:
     """Load app prompts and metadata from bulk_run results JSON.
 
@@ -975,7 +1830,7 @@ def load_prompts_from_bulk_results(bulk_results_file: Path) -> tuple[dict[str, s
         return {}, {}
 
     try:
-        data = json.loads(bulk_results_file.read_text())
+        data = json_loads(bulk_results_file.read_bytes())
 
         # Handle new format with metadata wrapper
         if "metadata" in data and "results" in data:
@@ -998,11 +1853,42 @@ def load_prompts_from_bulk_results(bulk_results_file: Path) -> tuple[dict[str, s
         return {}, {}
 
 
+def load_prompts_cached(bulk_results_file: Path) -> tuple[dict[str, str], dict[str, Any]]:
+    """load_prompts_from_bulk_results with a pickled sidecar in LLM_CACHE_DIR.
+
+    The sidecar is keyed on the source path and only reused while the file's
+    mtime and size are unchanged, so repeated single-app runs skip re-parsing
+    a large bulk results JSON.
+    """
+    try:
+        stat = bulk_results_file.stat()
+    except OSError:
+        return {}, {}
+    signature = (stat.st_mtime_ns, stat.st_size)
+    path_key = hashlib.blake2b(str(bulk_results_file.resolve()).encode(), digest_size=16).hexdigest()
+    sidecar = LLM_CACHE_DIR / f"prompts_{path_key}.pkl"
+
+    try:
+        cached_signature, data = pickle.loads(sidecar.read_bytes())
+        if cached_signature == signature:
+            return data
+    except Exception:
+        pass
+
+    data = load_prompts_from_bulk_results(bulk_results_file)
+    try:
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        sidecar.write_bytes(pickle.dumps((signature, data)))
+    except OSError:
+        pass
+    return data
+
+
 def main():
     """Main entry point."""
     if len(sys.argv) < 2:
         print("Usage: python evaluate_app.py <app_directory>")
-        print("   or: python evaluate_app.py --all")
+        print("   or: python evaluate_app.py --all [--jobs K] [--batch-llm]")
         sys.exit(1)
 
     script_dir = Path(__file__).parent
@@ -1010,16 +1896,54 @@ def main():
 
     # Load prompts and metadata from latest bulk results
     results_files = sorted(apps_dir.glob("bulk_run_results_*.json"), reverse=True)
-    prompts, bulk_metadata = load_prompts_from_bulk_results(results_files[0]) if results_files else ({}, {})
+    prompts, bulk_metadata = load_prompts_cached(results_files[0]) if results_files else ({}, {})
 
     if sys.argv[1] == "--all":
-        # Evaluate all apps
-        results = []
-        for app_dir in sorted(apps_dir.iterdir()):
-            if app_dir.is_dir() and not app_dir.name.startswith("."):
-                prompt = prompts.get(app_dir.name)
-                result = evaluate_app(app_dir, prompt)
-                results.append(asdict(result))
+        # Evaluate all apps concurrently - each evaluation is independent and mostly
+        # blocked on docker/npm/LLM calls. Every app gets its own host port (picked
+        # in the worker right before the app starts), and docker builds are capped
+        # at DOCKER_BUILD_SLOTS across all workers.
+        app_dirs = list_app_dirs(apps_dir)
+        args = sys.argv[2:]
+        max_workers = min(4, os.cpu_count() or 1)
+        if "--jobs" in args:
+            try:
+                max_workers = max(1, int(args[args.index("--jobs") + 1]))
+            except (IndexError, ValueError):
+                print("Error: --jobs requires an integer")
+                sys.exit(1)
+        batch_llm = anthropic is not None and "--batch-llm" in args
+        run_ts = int(time.time())
+        # Per-app results are appended as they finish so a crash keeps partial results
+        partial_file = script_dir / f"eval_results_{run_ts}.jsonl"
+        results_by_index: dict[int, dict] = {}
+        docker_slots = multiprocessing.BoundedSemaphore(DOCKER_BUILD_SLOTS)
+        with (
+            ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(docker_slots,)) as executor,
+            open(partial_file, "ab") as partial,
+        ):
+            futures = {
+                executor.submit(
+                    evaluate_app, app_dir, prompts.get(app_dir.name), None, defer_llm=batch_llm
+                ): i
+                for i, app_dir in enumerate(app_dirs)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results_by_index[index] = future.result().to_dict()
+                except Exception as e:
+                    print(f"❌ Error evaluating {app_dirs[index].name}: {e}")
+                    continue
+                # Partial records are pre-LLM; skip the (large) pending request payloads
+                record = results_by_index[index]
+                record = {**record, "details": {k: v for k, v in record["details"].items() if k != "pending_llm"}}
+                partial.write(json_dumps_bytes(record, indent=False) + b"\n")
+                partial.flush()
+        results = [results_by_index[i] for i in sorted(results_by_index)]
+
+        # Metrics 6-7 for every app in a single Message Batches job
+        apply_llm_verdicts(results)
 
         # Save combined results with bulk run metadata
         output_data = {
@@ -1027,9 +1951,10 @@ def main():
             "eval_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             "results": results,
         }
-        output_file = script_dir / f"eval_results_{int(time.time())}.json"
-        output_file.write_text(json.dumps(output_data, indent=2))
+        output_file = script_dir / f"eval_results_{run_ts}.json"
+        write_json(output_file, output_data)
         print(f"\n\nResults saved to: {output_file}")
+        print(f"Per-app results: {partial_file}")
         if bulk_metadata:
             print("Bulk run metadata:")
             for key, value in bulk_metadata.items():
@@ -1049,10 +1974,11 @@ def main():
         print("\n" + "=" * 60)
         print("EVALUATION RESULT")
         print("=" * 60)
-        print(json.dumps(asdict(result), indent=2))
+        result_dict = result.to_dict()
+        print(json_dumps_bytes(result_dict).decode())
 
         output_file = app_dir / "eval_result.json"
-        output_file.write_text(json.dumps(asdict(result), indent=2))
+        write_json(output_file, result_dict)
         print(f"\nResult saved to: {output_file}")
 
 
@@ -3,13 +3,19 @@
 
 Uses Dagger to run evaluations in isolated containers, eliminating port
 conflicts and machine environment pollution.
+
+Repeated invocations can share one warm engine: start a long-lived session
+(e.g. ``dagger run -- bash drive_evals.sh``) and every script launched inside
+it joins that session through DAGGER_SESSION_PORT/DAGGER_SESSION_TOKEN instead
+of booting its own engine. Set EVAL_DAGGER_DEBUG=1 to see engine logs.
 """
 
 import asyncio
-import json
+import functools
+import os
 import sys
 import time
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add the cli directory to Python path for imports
@@ -36,6 +42,8 @@ for env_path in env_paths:
 import dagger
 
 from ts_workspace import (
+    app_service,
+    build_base,
     create_ts_workspace,
     install_dependencies,
     build_app,
@@ -48,21 +56,87 @@ from ts_workspace import (
 from evaluate_app import (
     FullMetrics,
     EvalResult,
-    check_databricks_connectivity,
-    check_data_validity_llm,
-    check_ui_functional_vlm,
+    check_databricks_connectivity_async,
+    check_data_validity_llm_async,
+    check_ui_functional_vlm_async,
     check_local_runability,
     check_deployability,
-    load_prompts_from_bulk_results,
+    json_dumps_bytes,
+    json_loads,
+    list_app_dirs,
+    load_prompts_cached,
+    parse_coverage_pct,
+    scan_ts_sources,
 )
 from template_detection import detect_template
 
 
+@functools.lru_cache(maxsize=4096)
+def _template_cached(app_dir: str) -> str:
+    """Detect the template once per app directory for the whole run."""
+    return detect_template(Path(app_dir))
+
+
+@functools.lru_cache(maxsize=4096)
+def _gen_metrics(app_dir: str) -> dict | None:
+    """Load generation_metrics.json once per app directory (None if missing)."""
+    generation_metrics_file = Path(app_dir) / "generation_metrics.json"
+    if not generation_metrics_file.exists():
+        return None
+    return json_loads(generation_metrics_file.read_bytes())
+
+
+@functools.cache
+def _devnull():
+    """Process-wide /dev/null handle for discarded engine logs (opened once, never leaked per call)."""
+    return open(os.devnull, "w")
+
+
+def dagger_connection_config() -> dagger.Config:
+    """Connection config shared by the Dagger evaluation entry points.
+
+    Engine logs are discarded unless EVAL_DAGGER_DEBUG is set, which avoids
+    piping the progress stream through this process for every run.
+    """
+    if os.getenv("EVAL_DAGGER_DEBUG"):
+        return dagger.Config(log_output=sys.stderr)
+    return dagger.Config(log_output=_devnull())
+
+
+# Process-wide Dagger session, opened on first use and closed by close_client()
+_connection: dagger.Connection | None = None
+_client: dagger.Client | None = None
+
+
+async def get_client() -> dagger.Client:
+    """Return the shared Dagger client, connecting on first call.
+
+    Every evaluation in the process reuses this session, and callers decide
+    when to pay for the (slow) session cleanup by calling close_client().
+    Must be paired with close_client() from the same task.
+    """
+    global _connection, _client
+    if _client is None:
+        _connection = dagger.Connection(dagger_connection_config())
+        _client = await _connection.__aenter__()
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared Dagger session if one is open."""
+    global _connection, _client
+    if _connection is None:
+        return
+    connection, _connection, _client = _connection, None, None
+    await connection.__aexit__(None, None, None)
+
+
 async def evaluate_app_async(
     client: dagger.Client,
     app_dir: Path,
     prompt: str | None = None,
     port: int = 8000,
+    base: dagger.Container | None = None,
 ) -> EvalResult:
     """Run full evaluation on an app using Dagger.
 
@@ -71,16 +145,18 @@ async def evaluate_app_async(
         app_dir: Path to the app directory
         prompt: Optional prompt used to generate the app
         port: Port to use for the app (unique per parallel execution)
+        base: Shared base container from ts_workspace.build_base
     """
     print(f"\nEvaluating: {app_dir.name}")
     print("=" * 60)
 
     # Detect template type
-    template = detect_template(app_dir)
+    template = _template_cached(str(app_dir))
     print(f"  Template: {template}")
+    has_dockerfile = (app_dir / "Dockerfile").exists()
 
     # Skip only if template is unknown and has Dockerfile
-    if template == "unknown" and (app_dir / "Dockerfile").exists():
+    if template == "unknown" and has_dockerfile:
         print("  ⚠️  Docker-only apps not yet supported with Dagger wrapper")
         # Return minimal result
         metrics = FullMetrics()
@@ -107,6 +183,7 @@ async def evaluate_app_async(
             app_dir=app_dir,
             template=template,
             port=port,
+            base=base,
         )
 
         # Metric 0: Install dependencies
@@ -122,14 +199,14 @@ async def evaluate_app_async(
 
         # Metric 1: Build
         print("  [1/7] Checking build success...")
-        build_start = time.time()
+        build_start = time.perf_counter()
         build_result = await build_app(workspace)
-        build_time = time.time() - build_start
+        build_time = time.perf_counter() - build_start
 
         build_success = build_result.exit_code == 0
         metrics.build_success = build_success
         metrics.build_time_sec = round(build_time, 1)
-        metrics.has_dockerfile = (app_dir / "Dockerfile").exists()
+        metrics.has_dockerfile = has_dockerfile
 
         if not build_success:
             issues.append("Build failed")
@@ -137,13 +214,36 @@ async def evaluate_app_async(
         else:
             print("    ✅ Build successful")
 
-        # Metric 2: Runtime
-        print("  [2/7] Checking runtime success...")
-        startup_start = time.time()
-        try:
-            runtime_result = await check_runtime(workspace)
-            startup_time = time.time() - startup_start
+        # Metrics 2-4: runtime, type safety and tests don't depend on each
+        # other, so run them concurrently against the same workspace
+        async def _timed(coro):
+            start = time.perf_counter()
+            result = await coro
+            return result, time.perf_counter() - start
+
+        async def _skipped():
+            return None
+
+        print("  [2-4/7] Checking runtime, type safety and tests...")
+        # Use unique test port to avoid conflicts
+        test_port = port + 1000
+        runtime_outcome, typecheck_outcome, test_outcome = await asyncio.gather(
+            _timed(check_runtime(workspace)),
+            check_types(workspace) if deps_installed else _skipped(),
+            run_tests(workspace, test_port) if deps_installed else _skipped(),
+            return_exceptions=True,
+        )
 
+        # Metric 2: Runtime
+        if isinstance(runtime_outcome, Exception):
+            e = runtime_outcome
+            runtime_success = False
+            metrics.runtime_success = False
+            metrics.startup_time_sec = 0.0
+            issues.append(f"Runtime check error: {str(e)[:100]}")
+            print(f"    ⚠️  Runtime check error: {str(e)[:200]}")
+        else:
+            runtime_result, startup_time = runtime_outcome
             runtime_success = runtime_result.exit_code == 0
             metrics.runtime_success = runtime_success
             metrics.startup_time_sec = round(startup_time, 1)
@@ -157,95 +257,88 @@ async def evaluate_app_async(
                     print(f"       stderr: {runtime_result.stderr[:300]}")
             else:
                 print(f"    ✅ Runtime successful (startup: {startup_time:.1f}s)")
-        except Exception as e:
-            runtime_success = False
-            metrics.runtime_success = False
-            metrics.startup_time_sec = 0.0
-            issues.append(f"Runtime check error: {str(e)[:100]}")
-            print(f"    ⚠️  Runtime check error: {str(e)[:200]}")
 
         # Metric 3: Type safety (requires dependencies)
-        if deps_installed:
-            print("  [3/7] Checking type safety...")
-            typecheck_result = await check_types(workspace)
-            type_safety = typecheck_result.exit_code == 0
+        if not deps_installed:
+            print("  [3/7] Skipping type safety (dependencies failed)")
+        elif isinstance(typecheck_outcome, Exception):
+            issues.append(f"Type check error: {str(typecheck_outcome)[:100]}")
+            print(f"    ⚠️  Type check error: {str(typecheck_outcome)[:200]}")
+        else:
+            type_safety = typecheck_outcome.exit_code == 0
             metrics.type_safety = type_safety
 
             if not type_safety:
-                print(f"    ⚠️  Type errors: {typecheck_result.stderr[:200]}")
+                print(f"    ⚠️  Type errors: {typecheck_outcome.stderr[:200]}")
             else:
                 print("    ✅ Type safety passed")
-        else:
-            print("  [3/7] Skipping type safety (dependencies failed)")
 
         # Metric 4: Tests (requires dependencies)
-        if deps_installed:
-            print("  [4/7] Checking tests pass...")
-            # Use unique test port to avoid conflicts
-            test_port = port + 1000
-            try:
-                test_result = await run_tests(workspace, test_port)
-                tests_pass = test_result.exit_code == 0
-                metrics.tests_pass = tests_pass
-
-                # Parse coverage from output
-                coverage_pct = 0.0
-                output = test_result.stdout + test_result.stderr
-                for line in output.split("\n"):
-                    if "all files" in line.lower() and "%" in line:
-                        parts = line.split("|")
-                        if len(parts) >= 2:
-                            try:
-                                coverage_pct = float(parts[1].strip().replace("%", ""))
-                            except (ValueError, IndexError):
-                                pass
-
-                metrics.test_coverage_pct = coverage_pct
-
-                # Check if test files exist
-                backend_dirs = [app_dir / "server", app_dir / "backend"]
-                has_tests = False
-                for backend_dir in backend_dirs:
-                    if backend_dir.exists() and (backend_dir / "src").exists():
-                        test_files = list((backend_dir / "src").glob("**/*.test.ts"))
-                        if test_files:
-                            has_tests = True
-                            break
-                metrics.has_tests = has_tests
-
-                if not tests_pass:
-                    issues.append("Tests failed")
-                    print(f"    ⚠️  Tests failed (exit {test_result.exit_code})")
-                    print(f"       stderr: {test_result.stderr[:300]}")
-                else:
-                    print(f"    ✅ Tests passed (coverage: {coverage_pct:.1f}%)")
-            except Exception as e:
-                issues.append(f"Test execution error: {str(e)}")
-                print(f"    ⚠️  Test error: {str(e)[:200]}")
-        else:
+        if not deps_installed:
             print("  [4/7] Skipping tests (dependencies failed)")
+        elif isinstance(test_outcome, Exception):
+            issues.append(f"Test execution error: {str(test_outcome)}")
+            print(f"    ⚠️  Test error: {str(test_outcome)[:200]}")
+        else:
+            test_result = test_outcome
+            tests_pass = test_result.exit_code == 0
+            metrics.tests_pass = tests_pass
+
+            # Parse coverage from output
+            coverage_pct = parse_coverage_pct(test_result.stdout, test_result.stderr)
+            metrics.test_coverage_pct = coverage_pct
+
+            if not tests_pass:
+                issues.append("Tests failed")
+                print(f"    ⚠️  Tests failed (exit {test_result.exit_code})")
+                print(f"       stderr: {test_result.stderr[:300]}")
+            else:
+                print(f"    ✅ Tests passed (coverage: {coverage_pct:.1f}%)")
 
         # Remaining checks run on host (not in Dagger)
 
         # Metric 5: Databricks connectivity (only if runtime succeeded)
         if runtime_success:
-            db_success = check_databricks_connectivity(app_dir, template, port)
+            # Probe the app inside the Dagger session through a host tunnel
+            # instead of expecting a second copy of it on localhost
+            tunnel = await client.host().tunnel(app_service(workspace, port)).start()
+            try:
+                base_url = await tunnel.endpoint(scheme="http")
+                db_success = await check_databricks_connectivity_async(app_dir, template, port, base_url=base_url)
+            finally:
+                await tunnel.stop()
             metrics.databricks_connectivity = db_success
             if not db_success:
                 issues.append("Databricks connectivity failed")
 
-            # Metric 6: Data validity (LLM)
-            if db_success:
-                data_returned, data_details = check_data_validity_llm(app_dir, prompt, template)
-                metrics.data_returned = data_returned
-                if not data_returned:
-                    issues.append(f"Data validity concerns: {data_details}")
-
-            # Metric 7: UI functional (VLM)
-            ui_renders, ui_details = check_ui_functional_vlm(app_dir, prompt)
-            metrics.ui_renders = ui_renders
-            if not ui_renders:
-                issues.append(f"UI concerns: {ui_details}")
+            # Metrics 6-7 cost LLM/VLM calls; don't pay for them when an
+            # upstream check already failed (they stay False). The UI check only
+            # needs the running app, data validity also needs connectivity.
+            if build_success:
+
+                async def _no_data_check():
+                    return None
+
+                # Metrics 6-7: Data validity (LLM) and UI functional (VLM), concurrently
+                data_outcome, (ui_renders, ui_details) = await asyncio.gather(
+                    check_data_validity_llm_async(app_dir, prompt, template) if db_success else _no_data_check(),
+                    check_ui_functional_vlm_async(app_dir, prompt),
+                )
+                if data_outcome is not None:
+                    data_returned, data_details = data_outcome
+                    metrics.data_returned = data_returned
+                    if not data_returned:
+                        issues.append(f"Data validity concerns: {data_details}")
+                else:
+                    print("  [6/7] Skipping data check (Databricks connectivity failed)")
+                    issues.append("Data check skipped (upstream failure: Databricks connectivity)")
+
+                metrics.ui_renders = ui_renders
+                if not ui_renders:
+                    issues.append(f"UI concerns: {ui_details}")
+            else:
+                print("  [6-7/7] Skipping data/UI checks (build failed)")
+                issues.append("Data/UI checks skipped (upstream failure: build)")
         else:
             print("  [5-7/7] Skipping DB/data/UI checks (runtime failed)")
 
@@ -256,7 +349,7 @@ async def evaluate_app_async(
     # Calculate DevX metrics (run even if evaluation failed)
     try:
         # Metric 8: Local runability
-        local_score, local_details = check_local_runability(app_dir, template)
+        local_score, local_details = await asyncio.to_thread(check_local_runability, app_dir, template)
         metrics.local_runability_score = local_score
         details["local_runability"] = local_details
         if local_score < 3:
@@ -265,7 +358,7 @@ async def evaluate_app_async(
             )
 
         # Metric 9: Deployability
-        deploy_score, deploy_details = check_deployability(app_dir)
+        deploy_score, deploy_details = await asyncio.to_thread(check_deployability, app_dir)
         metrics.deployability_score = deploy_score
         details["deployability"] = deploy_details
         if deploy_score < 3:
@@ -296,11 +389,9 @@ async def evaluate_app_async(
     # Calculate efficiency metric (run even if evaluation failed)
     if metrics.eff_units is None:
         try:
-            import json
             from eval_metrics import eff_units
-            generation_metrics_file = app_dir / "generation_metrics.json"
-            if generation_metrics_file.exists():
-                generation_metrics = json.loads(generation_metrics_file.read_text())
+            generation_metrics = _gen_metrics(str(app_dir))
+            if generation_metrics is not None:
                 tokens = generation_metrics.get("input_tokens", 0) + generation_metrics.get("output_tokens", 0)
                 turns = generation_metrics.get("turns")
                 validations = generation_metrics.get("validation_runs")
@@ -313,10 +404,10 @@ async def evaluate_app_async(
         except Exception as e:
             print(f"  ⚠️  Could not calculate efficiency: {e}")
 
-    # Calculate LOC count (run even if evaluation failed)
+    # Calculate LOC count and test presence in one walk (run even if evaluation failed)
     if metrics.total_loc == 0:
         try:
-            metrics.total_loc = sum(1 for f in app_dir.rglob("*.ts") if f.is_file() and "node_modules" not in str(f))
+            metrics.total_loc, metrics.has_tests = await asyncio.to_thread(scan_ts_sources, app_dir)
         except Exception as e:
             print(f"  ⚠️  Could not calculate LOC: {e}")
 
@@ -334,6 +425,10 @@ async def evaluate_app_async(
 
 async def main_async():
     """Async main entry point."""
+    # Host-side checks (LLM calls, file walks) run via asyncio.to_thread; size
+    # the pool so concurrent apps don't queue behind each other
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=32))
+
     if len(sys.argv) < 2:
         print("Usage: python evaluate_app_dagger.py <app_directory>")
         print("   or: python evaluate_app_dagger.py --all")
@@ -344,30 +439,47 @@ async def main_async():
 
     # Load prompts
     results_files = sorted(apps_dir.glob("bulk_run_results_*.json"), reverse=True)
-    prompts, bulk_metadata = load_prompts_from_bulk_results(results_files[0]) if results_files else ({}, {})
+    prompts, bulk_metadata = load_prompts_cached(results_files[0]) if results_files else ({}, {})
 
     # Create Dagger client
-    async with dagger.Connection() as client:
+    async with dagger.Connection(dagger_connection_config()) as client:
+        # Warm the tool-equipped base once; every workspace starts from it
+        base = await build_base(client)
+
         if sys.argv[1] == "--all":
-            # Evaluate all apps
-            results = []
-            port = 8000
-
-            for app_dir in sorted(apps_dir.iterdir()):
-                if app_dir.is_dir() and not app_dir.name.startswith("."):
-                    prompt = prompts.get(app_dir.name)
-                    result = await evaluate_app_async(client, app_dir, prompt, port)
-                    results.append(asdict(result))
-                    port += 1  # Increment port for next app
-
-            # Save results
-            output_data = {
-                "bulk_run_metadata": bulk_metadata,
-                "eval_timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "results": results,
-            }
+            # Evaluate all apps concurrently on the shared Dagger client
+            app_dirs = list_app_dirs(apps_dir)
+            sem = asyncio.Semaphore(int(os.getenv("EVAL_CONCURRENCY", "8")))
+
+            async def _run(app_dir: Path):
+                async with sem:
+                    try:
+                        # Every app runs in its own container and is reached through a
+                        # Dagger tunnel, so all of them can use the default port
+                        return app_dir, await evaluate_app_async(client, app_dir, prompts.get(app_dir.name), base=base)
+                    except Exception as e:
+                        return app_dir, e
+
+            # Stream each result into the output file as it completes so memory
+            # stays flat and an interrupted run still leaves partial results
             output_file = script_dir / f"eval_results_{int(time.time())}.json"
-            output_file.write_text(json.dumps(output_data, indent=2))
+            eval_timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            with output_file.open("wb") as f:
+                f.write(b'{"bulk_run_metadata": ' + json_dumps_bytes(bulk_metadata, indent=False) + b", ")
+                f.write(b'"eval_timestamp": ' + json_dumps_bytes(eval_timestamp, indent=False) + b", ")
+                f.write(b'"results": [\n')
+                written = 0
+                for next_done in asyncio.as_completed([_run(app_dir) for app_dir in app_dirs]):
+                    app_dir, outcome = await next_done
+                    if isinstance(outcome, Exception):
+                        print(f"❌ Error evaluating {app_dir.name}: {outcome}")
+                        continue
+                    if written:
+                        f.write(b",\n")
+                    f.write(json_dumps_bytes(outcome.to_dict()))
+                    f.flush()
+                    written += 1
+                f.write(b"\n]}\n")
             print(f"\n\nResults saved to: {output_file}")
 
         else:
@@ -378,16 +490,17 @@ async def main_async():
                 sys.exit(1)
 
             prompt = prompts.get(app_dir.name)
-            result = await evaluate_app_async(client, app_dir, prompt, port=8000)
+            result = await evaluate_app_async(client, app_dir, prompt, port=8000, base=base)
 
             # Print and save result
             print("\n" + "=" * 60)
             print("EVALUATION RESULT")
             print("=" * 60)
-            print(json.dumps(asdict(result), indent=2))
+            result_json = json_dumps_bytes(result.to_dict())
+            print(result_json.decode())
 
             output_file = app_dir / "eval_result.json"
-            output_file.write_text(json.dumps(asdict(result), indent=2))
+            output_file.write_bytes(result_json)
             print(f"\nResult saved to: {output_file}")
 
 
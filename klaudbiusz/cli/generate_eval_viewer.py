@@ -6,12 +6,16 @@ from pathlib import Path
 from datetime import datetime
 
 
-def generate_html_viewer(eval_json_path: Path, output_path: Path):
-    """Generate a standalone HTML viewer for evaluation results."""
+def generate_html_viewer(eval_json_path: Path, output_path: Path, data: dict | None = None):
+    """Generate a standalone HTML viewer for evaluation results.
+
+    Pass the already-loaded report as ``data`` to skip re-reading eval_json_path.
+    """
 
     # Read evaluation data
-    with open(eval_json_path) as f:
-        data = json.load(f)
+    if data is None:
+        with open(eval_json_path) as f:
+            data = json.load(f)
 
     summary = data.get("summary", {})
     apps = data.get("apps", [])
@@ -7,6 +7,7 @@ code generation quality over time.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -38,6 +39,7 @@ class EvaluationTracker:
             os.environ.get('MLFLOW_EXPERIMENT_NAME', MLFLOW_EXPERIMENT_NAME)
         )
         self.client = None
+        self.run_id = None
         self.enabled = False
         self._setup_mlflow()
 
@@ -100,17 +102,12 @@ class EvaluationTracker:
 
         try:
             run = mlflow.start_run(run_name=run_name)
+            self.run_id = run.info.run_id
 
-            # Add default tags
-            mlflow.set_tag("framework", "klaudbiusz")
-            mlflow.set_tag("run_name", run_name)
+            # Default and custom tags go out in a single batch request
+            mlflow.set_tags({"framework": "klaudbiusz", "run_name": run_name, **(tags or {})})
 
-            # Add custom tags
-            if tags:
-                for key, value in tags.items():
-                    mlflow.set_tag(key, value)
-
-            return run.info.run_id
+            return self.run_id
         except Exception as e:
             print(f"⚠️  Failed to start MLflow run: {e}")
             return None
@@ -135,15 +132,13 @@ class EvaluationTracker:
             return
 
         try:
-            mlflow.log_param("mode", mode)
-            mlflow.log_param("total_apps", total_apps)
-            mlflow.log_param("timestamp", timestamp)
+            params = {"mode": mode, "total_apps": total_apps, "timestamp": timestamp}
 
             if model_version:
-                mlflow.log_param("model_version", model_version)
+                params["model_version"] = model_version
 
-            for key, value in kwargs.items():
-                mlflow.log_param(key, value)
+            params.update(kwargs)
+            mlflow.log_params(params)
 
         except Exception as e:
             print(f"⚠️  Failed to log parameters: {e}")
@@ -160,16 +155,18 @@ class EvaluationTracker:
 
         try:
             summary = evaluation_report.get('summary', {})
+            # Collected here and sent as one batch request at the end
+            metrics_batch = {}
 
             # Log only top-level aggregate metrics (appeval_100 + 2-3 key metrics)
             total_apps = summary.get('total_apps', 0)
             if total_apps > 0:
-                mlflow.log_metric("total_apps", total_apps)
+                metrics_batch["total_apps"] = total_apps
 
             # Log template distribution metrics
             template_dist = summary.get('template_distribution', {})
             for template_name, count in template_dist.items():
-                mlflow.log_metric(f"template_{template_name}_count", count)
+                metrics_batch[f"template_{template_name}_count"] = count
 
             # Log average scores from individual apps
             apps = evaluation_report.get('apps', [])
@@ -177,14 +174,14 @@ class EvaluationTracker:
                 # Average appeval_100 composite score (PRIMARY METRIC)
                 avg_appeval_100 = sum(app['metrics'].get('appeval_100', 0)
                                      for app in apps) / len(apps)
-                mlflow.log_metric("avg_appeval_100", avg_appeval_100)
+                metrics_batch["avg_appeval_100"] = avg_appeval_100
 
                 # Average eff_units efficiency metric (lower is better)
                 eff_values = [app['metrics'].get('eff_units') for app in apps
                              if app.get('metrics', {}).get('eff_units') is not None]
                 if eff_values:
                     avg_eff_units = sum(eff_values) / len(eff_values)
-                    mlflow.log_metric("avg_eff_units", avg_eff_units)
+                    metrics_batch["avg_eff_units"] = avg_eff_units
 
                 # Log per-app detailed metrics as MLflow Table
                 # Mapping internal names to standard names from Databricks Apps 2.0 spec
@@ -226,6 +223,9 @@ class EvaluationTracker:
                     df = pd.DataFrame(app_records)
                     mlflow.log_table(df, "app_metrics.json")
 
+            if metrics_batch:
+                mlflow.log_metrics(metrics_batch)
+
         except Exception as e:
             print(f"⚠️  Failed to log metrics: {e}")
 
@@ -240,19 +240,23 @@ class EvaluationTracker:
             return
 
         try:
+            metrics_batch = {}
             if 'cost_usd' in generation_metrics:
-                mlflow.log_metric("generation_cost_usd", generation_metrics['cost_usd'])
+                metrics_batch["generation_cost_usd"] = generation_metrics['cost_usd']
 
             if 'total_output_tokens' in generation_metrics:
-                mlflow.log_metric("total_output_tokens", generation_metrics['total_output_tokens'])
+                metrics_batch["total_output_tokens"] = generation_metrics['total_output_tokens']
 
             if 'avg_turns' in generation_metrics:
-                mlflow.log_metric("avg_turns_per_app", generation_metrics['avg_turns'])
+                metrics_batch["avg_turns_per_app"] = generation_metrics['avg_turns']
 
             # Cost efficiency: apps per dollar
             if 'cost_usd' in generation_metrics and generation_metrics['cost_usd'] > 0:
                 apps_per_dollar = generation_metrics.get('total_apps', 0) / generation_metrics['cost_usd']
-                mlflow.log_metric("apps_per_dollar", apps_per_dollar)
+                metrics_batch["apps_per_dollar"] = apps_per_dollar
+
+            if metrics_batch:
+                mlflow.log_metrics(metrics_batch)
 
         except Exception as e:
             print(f"⚠️  Failed to log generation metrics: {e}")
@@ -274,6 +278,28 @@ class EvaluationTracker:
         except Exception as e:
             print(f"⚠️  Failed to log artifact {file_path}: {e}")
 
+    def log_artifact_files(self, file_paths: List[str], artifact_path: Optional[str] = None):
+        """
+        Upload several files as artifacts of the current run concurrently.
+
+        Args:
+            file_paths: Paths of files to log; missing files are skipped
+            artifact_path: Optional subdirectory in artifact store
+        """
+        if not self.enabled or not self.client or not self.run_id:
+            return
+
+        def upload(file_path: str):
+            try:
+                if Path(file_path).exists():
+                    self.client.log_artifact(self.run_id, file_path, artifact_path)
+            except Exception as e:
+                print(f"⚠️  Failed to log artifact {file_path}: {e}")
+
+        # The client is thread-safe and addresses the run explicitly, unlike the fluent API
+        with ThreadPoolExecutor(max_workers=max(1, len(file_paths))) as executor:
+            list(executor.map(upload, file_paths))
+
     def log_artifacts_directory(self, dir_path: str, artifact_path: Optional[str] = None):
         """
         Log an entire directory as artifacts.
@@ -303,6 +329,7 @@ class EvaluationTracker:
 
         try:
             mlflow.end_run(status=status)
+            self.run_id = None
         except Exception as e:
             print(f"⚠️  Failed to end MLflow run: {e}")
 
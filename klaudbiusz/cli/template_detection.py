@@ -5,9 +5,11 @@ Automatically identifies which template/SDK was used to generate an app
 by examining the app structure and key files.
 """
 
+import functools
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=512)
 def detect_template(app_dir: Path) -> str:
     """
     Detect which template was used to generate the app.
@@ -17,6 +19,9 @@ def detect_template(app_dir: Path) -> str:
 
     Returns:
         Template type: "dbx-sdk", "trpc", "vite", or "unknown"
+
+    Results are memoized per path; the markers are never modified by the
+    evaluation, so repeat lookups skip the file reads and globs.
     """
     # DBX SDK markers (new template)
     if _is_dbx_sdk_app(app_dir):
@@ -4,18 +4,58 @@ This module provides utilities to create Dagger workspaces configured for
 evaluating TypeScript applications (tRPC, DBX-SDK, or Docker-based).
 """
 
+import os
 from pathlib import Path
 import dagger
 
 from workspace import Workspace
 from dagger_utils import ExecResult
 
+# Host paths never copied into the container. Keeping dependency, VCS, build
+# and evaluation output out of the context keeps its content hash stable so
+# unchanged apps hit the Dagger cache on re-runs.
+CONTEXT_EXCLUDE = [
+    "node_modules",
+    "**/node_modules",
+    ".git",
+    "**/.next",
+    "**/dist",
+    "**/build",
+    "**/coverage",
+    "**/.turbo",
+    "eval_result.json",
+]
+
+# Node.js 20 Alpine for speed and size, plus bash and curl for running
+# scripts and health checks
+BASE_IMAGE = "node:20-alpine"
+BASE_SETUP_CMDS = [
+    ["apk", "add", "--no-cache", "bash", "curl"],
+]
+
+# Only the tail of each stage's output is kept (errors and the coverage
+# summary are at the end); set EVAL_FULL_LOGS=1 to keep complete logs
+LOG_TAIL_BYTES = None if os.getenv("EVAL_FULL_LOGS") else 65536
+
+
+async def build_base(client: dagger.Client) -> dagger.Container:
+    """Build the tool-equipped Node.js base container shared by every app.
+
+    Built before any app files are added so all workspaces start from the
+    same cached layers; build it once per run and pass it to create_ts_workspace.
+    """
+    ctr = client.container().from_(BASE_IMAGE)
+    for cmd in BASE_SETUP_CMDS:
+        ctr = ctr.with_exec(cmd)
+    return await ctr.sync()
+
 
 async def create_ts_workspace(
     client: dagger.Client,
     app_dir: Path,
     template: str,
     port: int,
+    base: dagger.Container | None = None,
 ) -> Workspace:
     """Create a Dagger workspace for TypeScript app evaluation.
 
@@ -24,47 +64,40 @@ async def create_ts_workspace(
         app_dir: Path to the app directory on host
         template: Template type (trpc, dbx-sdk, or docker)
         port: Port to expose for the app (e.g., 8000, 8001, etc.)
+        base: Prebuilt container from build_base (built on demand if omitted)
 
     Returns:
         Workspace configured with Node.js, app files, and eval scripts
     """
 
     # Load app directory as Dagger Directory (exclude node_modules to force clean install)
-    app_context = client.host().directory(
-        str(app_dir),
-        exclude=["node_modules", "**/node_modules", "**/.next", "**/dist", "**/build"]
-    )
-
-    # Choose base image - Node.js 20 Alpine for speed and size
-    base_image = "node:20-alpine"
+    app_context = client.host().directory(str(app_dir), exclude=CONTEXT_EXCLUDE)
 
-    # Setup commands to install required tools
-    setup_cmds = [
-        # Install bash and curl for running scripts and health checks
-        ["apk", "add", "--no-cache", "bash", "curl"],
-    ]
-
-    # Create workspace with app directory mounted
+    # Create workspace with app directory mounted on the shared base
+    if base is None:
+        base = await build_base(client)
     workspace = await Workspace.create(
         client=client,
-        base_image=base_image,
         context=app_context,
-        setup_cmd=setup_cmds,
+        base=base,
     )
 
+    # Share the npm download cache across every app (and across runs) so each
+    # package tarball is fetched once; prefer it over re-validating metadata
+    workspace.ctr = workspace.ctr.with_mounted_cache("/root/.npm", client.cache_volume("npm-cache"))
+    workspace.ctr = workspace.ctr.with_env_variable("npm_config_prefer_offline", "true")
+
     # Copy all eval scripts into container
     eval_dir = Path(__file__).parent / "eval" / template
 
-    # Copy all .sh files from eval directory
+    # Copy all .sh files from eval directory (sorted so the layer chain is deterministic)
     if eval_dir.exists():
-        for script_path in eval_dir.glob("*.sh"):
+        for script_path in sorted(eval_dir.glob("*.sh")):
             script_name = script_path.name
             content = script_path.read_text()
             workspace = workspace.write_file(f"/eval/{script_name}", content, force=True)
 
     # Set environment variables for evaluation
-    import os
-
     # Pass Databricks credentials from host environment
     databricks_host = os.getenv("DATABRICKS_HOST", "")
     databricks_token = os.getenv("DATABRICKS_TOKEN", "")
@@ -97,7 +130,7 @@ async def install_dependencies(workspace: Workspace) -> ExecResult:
         ExecResult with exit code, stdout, stderr
     """
     # Use update_ctr=True to persist node_modules in the container
-    return await workspace.exec(["bash", "/eval/install.sh"], update_ctr=True)
+    return await workspace.exec(["bash", "/eval/install.sh"], update_ctr=True, tail_bytes=LOG_TAIL_BYTES)
 
 
 async def build_app(workspace: Workspace) -> ExecResult:
@@ -109,7 +142,8 @@ async def build_app(workspace: Workspace) -> ExecResult:
     Returns:
         ExecResult with exit code, stdout, stderr
     """
-    return await workspace.exec(["bash", "/eval/build.sh"])
+    # Keep the build output in the workspace so runtime/tests reuse its layers
+    return await workspace.exec(["bash", "/eval/build.sh"], update_ctr=True, tail_bytes=LOG_TAIL_BYTES)
 
 
 async def check_runtime(workspace: Workspace) -> ExecResult:
@@ -139,10 +173,28 @@ async def check_runtime(workspace: Workspace) -> ExecResult:
             exit 1; \
         fi
         """
-    ])
+    ], tail_bytes=LOG_TAIL_BYTES)
     return result
 
 
+def app_service(workspace: Workspace, port: int) -> dagger.Service:
+    """Run the app server as a long-lived Dagger service.
+
+    Args:
+        workspace: Configured TypeScript workspace (dependencies installed)
+        port: Port the server listens on
+
+    Returns:
+        Service that Dagger starts once its exposed port is accepting connections
+    """
+    return (
+        workspace.ctr.with_workdir("/app/server")
+        .with_exposed_port(port)
+        .with_exec(["npx", "tsx", "src/index.ts"])
+        .as_service()
+    )
+
+
 async def run_tests(workspace: Workspace, test_port: int) -> ExecResult:
     """Run tests using test.sh script.
 
@@ -156,7 +208,7 @@ async def run_tests(workspace: Workspace, test_port: int) -> ExecResult:
     # Set TEST_PORT env var for tests
     workspace.ctr = workspace.ctr.with_env_variable("TEST_PORT", str(test_port))
     # Run tests directly without bash script to see actual npm test output
-    return await workspace.exec(["sh", "-c", "cd server && npm test || true"])
+    return await workspace.exec(["sh", "-c", "cd server && npm test || true"], tail_bytes=LOG_TAIL_BYTES)
 
 
 async def check_types(workspace: Workspace) -> ExecResult:
@@ -168,4 +220,4 @@ async def check_types(workspace: Workspace) -> ExecResult:
     Returns:
         ExecResult with exit code, stdout, stderr
     """
-    return await workspace.exec(["bash", "/eval/typecheck.sh"])
+    return await workspace.exec(["bash", "/eval/typecheck.sh"], tail_bytes=LOG_TAIL_BYTES)
@@ -15,7 +15,7 @@ from tenacity import (
     before_sleep_log,
 )
 
-from dagger_utils import ExecResult
+from dagger_utils import ExecResult, tail_capture
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +53,7 @@ class Workspace:
         base_image: str = "alpine",
         context: Directory | None = None,
         setup_cmd: list[list[str]] = [],
+        base: Container | None = None,
     ) -> Self:
         """Create a new workspace with the given base image and context.
 
@@ -61,14 +62,15 @@ class Workspace:
             base_image: Docker base image (e.g., "node:20-alpine")
             context: Optional directory to mount as /app
             setup_cmd: List of commands to run during setup
+            base: Prebuilt container to start from instead of base_image
 
         Returns:
             Configured Workspace instance
         """
         my_context = context or client.directory()
-        ctr = (
-            client.container().from_(base_image).with_workdir("/app").with_directory("/app", my_context)
-        )
+        if base is None:
+            base = client.container().from_(base_image)
+        ctr = base.with_workdir("/app").with_directory("/app", my_context)
 
         # Run setup commands (sync to force execution)
         for cmd in setup_cmd:
@@ -81,22 +83,29 @@ class Workspace:
         return cls(ctr=ctr, client=client)
 
     @no_retry  # Don't retry command failures - we want immediate feedback
-    async def exec(self, command: list[str], cwd: str = ".", update_ctr: bool = False) -> ExecResult:
+    async def exec(
+        self, command: list[str], cwd: str = ".", update_ctr: bool = False, tail_bytes: int | None = None
+    ) -> ExecResult:
         """Execute a command in the workspace.
 
         Args:
             command: Command to execute (as list of strings)
             cwd: Working directory (default: ".")
             update_ctr: If True, update self.ctr with the result container (for operations that modify filesystem)
+            tail_bytes: Fetch only the last N bytes of stdout/stderr (None keeps everything);
+                a failing command still raises with its complete output
 
         Returns:
             ExecResult with exit code, stdout, stderr
         """
+        if tail_bytes is not None:
+            command = tail_capture(command)
         result_ctr = self.ctr.with_workdir(cwd).with_exec(command)
         if update_ctr:
-            # Sync to force execution and capture filesystem changes
-            self.ctr = await result_ctr.sync()
-        return await ExecResult.from_ctr(result_ctr)
+            # Sync to force execution and capture filesystem changes; read the
+            # outputs from the synced container so the exec isn't resolved twice
+            result_ctr = self.ctr = await result_ctr.sync()
+        return await ExecResult.from_ctr(result_ctr, tail_bytes)
 
     def write_file(self, path: str, contents: str, force: bool = False) -> Self:
         """Write a file to the workspace.